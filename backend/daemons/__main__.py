@@ -0,0 +1,8 @@
+"""
+Allow running the CLI as ``python -m daemons``.
+"""
+
+from daemons.cli import main
+
+if __name__ == "__main__":
+    main(prog_name="daemons")
@@ -4,7 +4,7 @@ from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import event, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -32,6 +32,18 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Give SQLite more room for the table copies batch migrations perform.
+
+    Only per-connection settings are changed; journal mode and durability
+    stay whatever the database already uses.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-262144")
+    cursor.close()
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -87,6 +99,8 @@ async def run_async_migrations() -> None:
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
+    if connectable.dialect.name == "sqlite":
+        event.listen(connectable.sync_engine, "connect", _set_sqlite_pragmas)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
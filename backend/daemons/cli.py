@@ -9,13 +9,18 @@ Usage:
     daemons wright        Launch Daemonswright content studio
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import click
 
 from daemons import __version__
 
+# Installed daemons package directory (bundled world_data and migrations)
+_PKG_DIR = Path(__file__).parent
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="daemons")
@@ -24,10 +29,199 @@ def main():
     pass
 
 
+# Starter files written by `daemons init`
+_MAIN_PY = '''"""
+Game server entry point.
+
+Run with: daemons run
+Or use: uvicorn daemons.main:app --reload
+"""
+
+from daemons.main import app
+
+# Re-export the FastAPI app for uvicorn
+__all__ = ["app"]
+'''
+
+_CONFIG_PY = '''"""
+Game configuration.
+
+Customize these settings for your game.
+"""
+
+import os
+
+# Server settings
+HOST = os.getenv("DAEMONS_HOST", "127.0.0.1")
+PORT = int(os.getenv("DAEMONS_PORT", "8000"))
+
+# Database settings
+DATABASE_URL = os.getenv("DAEMONS_DATABASE_URL", "sqlite+aiosqlite:///./dungeon.db")
+
+# JWT settings (generate your own secret for production!)
+JWT_SECRET = os.getenv("DAEMONS_JWT_SECRET", "change-me-in-production")
+JWT_ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 60
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+
+# Game settings
+GAME_NAME = "My Daemons Game"
+STARTING_ROOM = "room_1_1_1"
+MAX_PLAYERS = 100
+
+# Content directories
+WORLD_DATA_DIR = "world_data"
+BEHAVIORS_DIR = "behaviors"
+'''
+
+_GITIGNORE = """# Daemons game project
+*.db
+*.pyc
+__pycache__/
+.venv/
+venv/
+.env
+*.log
+htmlcov/
+.coverage
+.pytest_cache/
+"""
+
+# (path, content, emoji) for each starter file, in the order init reports them
+_STARTER_FILES = (
+    ("main.py", _MAIN_PY, "🥧"),
+    ("config.py", _CONFIG_PY, "⚙️"),
+    (".gitignore", _GITIGNORE, "💁"),
+)
+
+
+# Empty world_data layout used when the package has no bundled content
+_FALLBACK_WORLD_DIRS = (
+    "world_data/areas",
+    "world_data/rooms",
+    "world_data/items/weapons",
+    "world_data/items/armor",
+    "world_data/items/consumables",
+    "world_data/npcs",
+    "world_data/npc_spawns",
+    "world_data/quests",
+    "world_data/quest_chains",
+    "world_data/dialogues",
+    "world_data/triggers",
+    "world_data/classes",
+    "world_data/abilities",
+    "world_data/factions",
+)
+
+
+def _dir_nonempty(path: Path) -> bool:
+    """Check whether a directory exists and has any entries."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _find_project_dirs(limit: int = 3) -> list[str]:
+    """Name up to limit subdirectories of the cwd that contain a main.py.
+
+    scandir already knows each entry's type, so only directories cost a
+    stat, and the scan stops as soon as enough projects are found.
+    """
+    found: list[str] = []
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "main.py")):
+                found.append(entry.name)
+                if len(found) >= limit:
+                    break
+    return found
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that.
+
+    Returns:
+        True if the file was written.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content)
+    return True
+
+
+def _scan_tree(root: str) -> tuple[list[str], list[str]]:
+    """List the directories and files under root, relative to root.
+
+    Walks with os.scandir, which reuses directory entry types instead of
+    stat'ing every path the way Path.rglob does. Directories are listed
+    parents-first. Symlinks are followed like shutil.copytree does; a
+    directory link back to one of its own ancestors is skipped, so a link
+    cycle can't loop the walk.
+    """
+    dirs: list[str] = []
+    files: list[str] = []
+    root_stat = os.stat(root)
+    # Each pending directory carries the (st_dev, st_ino) of its ancestors
+    stack = [("", frozenset({(root_stat.st_dev, root_stat.st_ino)}))]
+    while stack:
+        rel_dir, ancestors = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir():
+                    dir_stat = entry.stat()
+                    dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                    if dir_key in ancestors:
+                        continue
+                    dirs.append(rel_path)
+                    stack.append((rel_path, ancestors | {dir_key}))
+                else:
+                    files.append(rel_path)
+    return dirs, files
+
+
+def _copy_tree(src: Path, dst: Path, workers: int = 16) -> list[str]:
+    """Copy the src tree to dst, copying files on a thread pool.
+
+    Same result as shutil.copytree (symlinks are copied as the files and
+    directories they point to), but the many small per-file copies overlap
+    instead of running one after another.
+
+    Returns:
+        The copied files, relative to dst.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    dirs, files = _scan_tree(str(src))
+
+    dst.mkdir(parents=True)
+    for rel_dir in dirs:
+        (dst / rel_dir).mkdir()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # list() drains the results so the first failed copy is raised
+        list(pool.map(lambda rel: shutil.copy2(src / rel, dst / rel), files))
+
+    return files
+
+
 @main.command()
 @click.argument("name", default="my-game")
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing files")
-def init(name: str, force: bool):
+@click.option(
+    "--jobs",
+    "-j",
+    default=16,
+    type=click.IntRange(min=1),
+    help="Number of files to copy in parallel",
+)
+def init(name: str, force: bool, jobs: int):
     """Initialize a new game project with starter content.
 
     NAME is the project directory name (default: my-game).
@@ -37,12 +231,13 @@ def init(name: str, force: bool):
         daemons init my-rpg
         daemons init .
         daemons init --force existing-project
+        daemons init --jobs 4 my-rpg
     """
     import shutil
 
     project_dir = Path.cwd() / name if name != "." else Path.cwd()
 
-    if project_dir.exists() and any(project_dir.iterdir()) and not force:
+    if not force and _dir_nonempty(project_dir):
         if name != ".":
             click.echo(f"⚠️ Error: Directory '{name}' already exists and is not empty.")
             click.echo("Use --force to overwrite, or choose a different name.")
@@ -51,7 +246,7 @@ def init(name: str, force: bool):
     click.echo(f"Initializing Daemons project in {project_dir}...")
 
     # Find the bundled world_data directory from the installed package
-    package_world_data = Path(__file__).parent / "world_data"
+    package_world_data = _PKG_DIR / "world_data"
 
     # Create project directory
     project_dir.mkdir(parents=True, exist_ok=True)
@@ -62,110 +257,36 @@ def init(name: str, force: bool):
         if dest_world_data.exists() and force:
             shutil.rmtree(dest_world_data)
         if not dest_world_data.exists():
-            shutil.copytree(package_world_data, dest_world_data)
+            world_files = _copy_tree(package_world_data, dest_world_data, workers=jobs)
             click.echo("🗺️  Copied world_data/ (all starter content)")
         else:
+            _, world_files = _scan_tree(str(dest_world_data))
             click.echo("🗺️  Skipped world_data/ (already exists)")
 
-        # Count copied files
-        yaml_count = len(list(dest_world_data.rglob("*.yaml")))
+        # Count from the copy's own file list instead of walking the tree again
+        yaml_count = sum(1 for f in world_files if f.endswith(".yaml"))
         click.echo(f"📁    ({yaml_count} YAML files)")
     else:
         # Fallback: create empty directory structure
         click.echo("⚠️  Warning: Bundled world_data not found, creating empty structure")
-        directories = [
-            "world_data/areas",
-            "world_data/rooms",
-            "world_data/items/weapons",
-            "world_data/items/armor",
-            "world_data/items/consumables",
-            "world_data/npcs",
-            "world_data/npc_spawns",
-            "world_data/quests",
-            "world_data/quest_chains",
-            "world_data/dialogues",
-            "world_data/triggers",
-            "world_data/classes",
-            "world_data/abilities",
-            "world_data/factions",
-        ]
-        for dir_path in directories:
+        for dir_path in _FALLBACK_WORLD_DIRS:
             (project_dir / dir_path).mkdir(parents=True, exist_ok=True)
 
     # Create behaviors directory
     (project_dir / "behaviors").mkdir(parents=True, exist_ok=True)
     click.echo("😇  Created behaviors/")
 
-    # Create main.py
-    main_py = '''"""
-Game server entry point.
-
-Run with: daemons run
-Or use: uvicorn daemons.main:app --reload
-"""
-
-from daemons.main import app
-
-# Re-export the FastAPI app for uvicorn
-__all__ = ["app"]
-'''
-    (project_dir / "main.py").write_text(main_py)
-    click.echo("🥧  Created main.py")
-
-    # Create config.py
-    config_py = '''"""
-Game configuration.
-
-Customize these settings for your game.
-"""
-
-import os
-
-# Server settings
-HOST = os.getenv("DAEMONS_HOST", "127.0.0.1")
-PORT = int(os.getenv("DAEMONS_PORT", "8000"))
-
-# Database settings
-DATABASE_URL = os.getenv("DAEMONS_DATABASE_URL", "sqlite+aiosqlite:///./dungeon.db")
-
-# JWT settings (generate your own secret for production!)
-JWT_SECRET = os.getenv("DAEMONS_JWT_SECRET", "change-me-in-production")
-JWT_ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
-REFRESH_TOKEN_EXPIRE_DAYS = 7
-
-# Game settings
-GAME_NAME = "My Daemons Game"
-STARTING_ROOM = "room_1_1_1"
-MAX_PLAYERS = 100
-
-# Content directories
-WORLD_DATA_DIR = "world_data"
-BEHAVIORS_DIR = "behaviors"
-'''
-    (project_dir / "config.py").write_text(config_py)
-    click.echo("⚙️  Created config.py")
-
     # Note: We don't create a local alembic folder by default.
     # The 'daemons db upgrade' command will use the package's built-in migrations.
     # If users need custom migrations, they can run 'daemons db init-migrations' (future feature)
     # or manually create an alembic folder.
 
-    # Create .gitignore
-    gitignore = """# Daemons game project
-*.db
-*.pyc
-__pycache__/
-.venv/
-venv/
-.env
-*.log
-htmlcov/
-.coverage
-.pytest_cache/
-"""
-    (project_dir / ".gitignore").write_text(gitignore)
-    click.echo("💁  Created .gitignore")
+    # Create main.py, config.py and .gitignore
+    for file_name, content, emoji in _STARTER_FILES:
+        if _write_if_changed(project_dir / file_name, content):
+            click.echo(f"{emoji}  Created {file_name}")
+        else:
+            click.echo(f"{emoji}  Skipped {file_name} (already up to date)")
 
     click.echo("")
     click.echo(
@@ -275,13 +396,13 @@ def run(host: str, port: int, reload: bool, workers: int, production: bool):
         )
     else:
         # Check if there's a project directory nearby (user might be in wrong dir)
-        possible_dirs = [d for d in Path(".").iterdir() if d.is_dir() and (d / "main.py").exists()]
+        possible_dirs = _find_project_dirs()
         if possible_dirs:
             click.echo(click.style("📂 No main.py found in current directory.", fg="yellow"))
             click.echo("")
             click.echo("📂 Found project directory nearby. Try:")
-            for d in possible_dirs[:3]:  # Show up to 3
-                click.echo(f"  cd {d.name} && daemons run")
+            for name in possible_dirs:
+                click.echo(f"  cd {name} && daemons run")
             click.echo("")
             # Still run the engine directly as fallback
 
@@ -303,6 +424,30 @@ def run(host: str, port: int, reload: bool, workers: int, production: bool):
         )
 
 
+@lru_cache(maxsize=1)
+def _package_alembic_dir() -> str:
+    """Get the location of the migrations bundled with the engine."""
+    return str(_PKG_DIR / "alembic")
+
+
+def _load_alembic_config():
+    """Build the Alembic config shared by the db commands.
+
+    Uses alembic.ini from the current directory if there is one, otherwise
+    the engine's built-in migrations against ./dungeon.db.
+    """
+    from alembic.config import Config
+
+    alembic_ini = Path("alembic.ini")
+    if alembic_ini.exists():
+        return Config(str(alembic_ini))
+
+    alembic_cfg = Config()
+    alembic_cfg.set_main_option("script_location", _package_alembic_dir())
+    alembic_cfg.set_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./dungeon.db")
+    return alembic_cfg
+
+
 @main.group()
 def db():
     """Database management commands."""
@@ -314,21 +459,13 @@ def db():
 def upgrade(revision: str):
     """Run database migrations to upgrade the schema."""
     from alembic import command
-    from alembic.config import Config
 
     # Look for alembic.ini in current directory or use package default
-    alembic_ini = Path("alembic.ini")
-
-    if alembic_ini.exists():
+    alembic_cfg = _load_alembic_config()
+    if alembic_cfg.config_file_name:
         click.echo("🗃️ Running migrations from local alembic.ini...")
-        alembic_cfg = Config(str(alembic_ini))
     else:
-        # Use the engine's built-in migrations
         click.echo("🗃️ Running engine migrations...")
-        package_dir = Path(__file__).parent
-        alembic_cfg = Config()
-        alembic_cfg.set_main_option("script_location", str(package_dir / "alembic"))
-        alembic_cfg.set_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./dungeon.db")
 
     try:
         command.upgrade(alembic_cfg, revision)
@@ -343,17 +480,8 @@ def upgrade(revision: str):
 def downgrade(revision: str):
     """Downgrade the database schema."""
     from alembic import command
-    from alembic.config import Config
-
-    alembic_ini = Path("alembic.ini")
 
-    if alembic_ini.exists():
-        alembic_cfg = Config(str(alembic_ini))
-    else:
-        package_dir = Path(__file__).parent
-        alembic_cfg = Config()
-        alembic_cfg.set_main_option("script_location", str(package_dir / "alembic"))
-        alembic_cfg.set_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./dungeon.db")
+    alembic_cfg = _load_alembic_config()
 
     try:
         command.downgrade(alembic_cfg, revision)
@@ -367,17 +495,8 @@ def downgrade(revision: str):
 def current():
     """Show current database revision."""
     from alembic import command
-    from alembic.config import Config
 
-    alembic_ini = Path("alembic.ini")
-
-    if alembic_ini.exists():
-        alembic_cfg = Config(str(alembic_ini))
-    else:
-        package_dir = Path(__file__).parent
-        alembic_cfg = Config()
-        alembic_cfg.set_main_option("script_location", str(package_dir / "alembic"))
-        alembic_cfg.set_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./dungeon.db")
+    alembic_cfg = _load_alembic_config()
 
     command.current(alembic_cfg)
 
@@ -386,17 +505,8 @@ def current():
 def history():
     """Show migration history."""
     from alembic import command
-    from alembic.config import Config
 
-    alembic_ini = Path("alembic.ini")
-
-    if alembic_ini.exists():
-        alembic_cfg = Config(str(alembic_ini))
-    else:
-        package_dir = Path(__file__).parent
-        alembic_cfg = Config()
-        alembic_cfg.set_main_option("script_location", str(package_dir / "alembic"))
-        alembic_cfg.set_main_option("sqlalchemy.url", "sqlite+aiosqlite:///./dungeon.db")
+    alembic_cfg = _load_alembic_config()
 
     command.history(alembic_cfg)
 
@@ -429,6 +539,7 @@ def client(host: str, port: int):
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
 def _get_wright_cache_dir() -> Path:
     """Get the cache directory for Daemonswright binaries."""
     if sys.platform == "win32":
@@ -440,6 +551,7 @@ def _get_wright_cache_dir() -> Path:
     return base / "wright"
 
 
+@lru_cache(maxsize=1)
 def _get_platform_info() -> tuple[str, str, str]:
     """Get platform info for downloading the correct binary.
 
@@ -460,27 +572,157 @@ def _get_platform_info() -> tuple[str, str, str]:
         return ("linux", ".AppImage", "Daemonswright.AppImage")
 
 
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BACKOFF = 0.3  # seconds, doubled after each failed attempt
+
+
+def _urlopen(req, timeout: float, attempts: int = 3):
+    """Open a URL, retrying rate limits, server errors and dropped connections.
+
+    Other HTTP errors (404, 304, ...) are raised straight away.
+    """
+    import time
+    import urllib.error
+    import urllib.request
+
+    for attempt in range(attempts):
+        try:
+            return urllib.request.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code not in _RETRY_STATUSES or attempt == attempts - 1:
+                raise
+        except (urllib.error.URLError, TimeoutError):
+            if attempt == attempts - 1:
+                raise
+        time.sleep(_RETRY_BACKOFF * 2**attempt)
+
+
+_RELEASES_META = "releases_meta.json"
+_RELEASES_MAX_AGE = 15 * 60  # seconds before asking GitHub again
+
+
 def _get_latest_wright_version() -> str | None:
-    """Fetch the latest Daemonswright version from GitHub releases."""
+    """Fetch the latest Daemonswright version from GitHub releases.
+
+    The answer is cached next to the downloads with the response's ETag.
+    A fresh answer is reused as-is; an older one is revalidated with a
+    conditional request, which GitHub answers with an empty 304 that
+    doesn't count against the API rate limit.
+    """
     import json
+    import time
+    import urllib.error
     import urllib.request
 
     api_url = "https://api.github.com/repos/adamhuston/daemons-engine/releases"
+    meta_path = _get_wright_cache_dir() / _RELEASES_META
 
     try:
-        req = urllib.request.Request(api_url, headers={"User-Agent": "daemons-cli"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            releases = json.loads(response.read().decode())
-
-            # Find the first release that has daemonswright assets
-            for release in releases:
-                for asset in release.get("assets", []):
-                    if "daemonswright" in asset["name"].lower():
-                        return release["tag_name"]
-            return None
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        meta = {}
+
+    cached_tag = meta.get("tag_name")
+    if cached_tag and time.time() - meta.get("fetched_at", 0) < _RELEASES_MAX_AGE:
+        return cached_tag
+
+    headers = {"User-Agent": "daemons-cli"}
+    if cached_tag and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+
+    try:
+        req = urllib.request.Request(api_url, headers=headers)
+        with _urlopen(req, timeout=10) as response:
+            releases = json.loads(response.read())
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_tag:
+            _save_releases_meta(meta_path, meta["etag"], cached_tag)
+            return cached_tag
+        return None
     except Exception:
         return None
 
+    # Find the first release that has daemonswright assets
+    for release in releases:
+        for asset in release.get("assets", []):
+            if "daemonswright" in asset["name"].lower():
+                _save_releases_meta(meta_path, etag, release["tag_name"])
+                return release["tag_name"]
+    return None
+
+
+def _save_releases_meta(meta_path: Path, etag: str | None, tag_name: str) -> None:
+    """Cache the latest release tag for _get_latest_wright_version."""
+    import json
+    import time
+
+    meta = {"etag": etag, "tag_name": tag_name, "fetched_at": time.time()}
+    try:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta_path.write_text(json.dumps(meta))
+    except OSError:
+        pass  # Caching is best-effort
+
+
+_WRIGHT_EXE_MARKER = "exe_path.txt"
+
+
+def _remember_wright_exe(version_dir: Path, exe_path: Path) -> None:
+    """Record where a version's executable is, so later runs skip the search."""
+    relative = exe_path.relative_to(version_dir)
+    (version_dir / _WRIGHT_EXE_MARKER).write_text(relative.as_posix())
+
+
+def _extract_zip(archive_path: Path, extract_dir: Path, workers: int = 8) -> None:
+    """Extract a zip archive, writing its files on a thread pool.
+
+    ZipFile objects can't be shared between threads, so each worker opens
+    its own; ZipFile.extract still sanitizes every member path.
+    """
+    import posixpath
+    import threading
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    with zipfile.ZipFile(archive_path) as zf:
+        infos = zf.infolist()
+        # Create every directory first so workers never race on a parent
+        dirs = {posixpath.dirname(info.filename.rstrip("/")) for info in infos}
+        dirs.update(info.filename.rstrip("/") for info in infos if info.is_dir())
+        for dir_name in sorted(dirs - {""}):
+            zf.extract(zipfile.ZipInfo(dir_name + "/"), extract_dir)
+
+    local = threading.local()
+    opened: list[zipfile.ZipFile] = []
+
+    def extract_one(info: zipfile.ZipInfo) -> None:
+        worker_zf = getattr(local, "zf", None)
+        if worker_zf is None:
+            worker_zf = local.zf = zipfile.ZipFile(archive_path)
+            opened.append(worker_zf)
+        worker_zf.extract(info, extract_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(extract_one, [i for i in infos if not i.is_dir()]))
+    finally:
+        for worker_zf in opened:
+            worker_zf.close()
+
+
+def _cached_wright_exe(version_dir: Path) -> Path | None:
+    """Get a version's executable from its download marker, if still there."""
+    try:
+        exe_path = version_dir / (version_dir / _WRIGHT_EXE_MARKER).read_text().strip()
+    except OSError:
+        return None
+    return exe_path if exe_path.exists() else None
+
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+_PROGRESS_INTERVAL = 0.1  # seconds between progress bar redraws
+
 
 def _download_wright(version: str, cache_dir: Path) -> Path | None:
     """Download Daemonswright binary for the current platform.
@@ -488,7 +730,7 @@ def _download_wright(version: str, cache_dir: Path) -> Path | None:
     Returns:
         Path to the executable, or None if download failed.
     """
-    import shutil
+    import time
     import urllib.request
     import zipfile
 
@@ -502,36 +744,82 @@ def _download_wright(version: str, cache_dir: Path) -> Path | None:
     version_dir = cache_dir / version
     version_dir.mkdir(parents=True, exist_ok=True)
 
-    archive_path = version_dir / asset_name
-
-    click.echo(f"📦 Downloading Daemonswright {version} for {platform_name}...")
-    click.echo(f"   URL: {download_url}")
-    click.echo("")
+    # A marker is only written once a version is fully installed
+    exe_path = _cached_wright_exe(version_dir)
+    if exe_path:
+        click.echo(f"📦 Daemonswright {version} is already downloaded.")
+        return exe_path
 
-    try:
-        # Download with progress
-        def reporthook(block_num, block_size, total_size):
-            if total_size > 0:
-                downloaded = block_num * block_size
-                percent = min(100, (downloaded / total_size) * 100)
-                bar_len = 40
-                filled = int(bar_len * percent / 100)
-                bar = "█" * filled + "░" * (bar_len - filled)
-                click.echo(f"\r   [{bar}] {percent:.1f}%", nl=False)
-
-        urllib.request.urlretrieve(download_url, archive_path, reporthook)
-        click.echo("")  # New line after progress bar
-        click.echo(click.style("   ✓ Download complete!", fg="green"))
+    archive_path = version_dir / asset_name
+    partial_path = version_dir / f"{asset_name}.part"
+
+    # Older versions downloaded straight to the archive name and could leave
+    # a truncated file behind, so check a leftover zip before reusing it
+    if (
+        archive_path.exists()
+        and archive_ext == ".zip"
+        and not zipfile.is_zipfile(archive_path)
+    ):
+        archive_path.unlink()
+
+    if archive_path.exists():
+        # Left by an earlier run that stopped before extracting
+        click.echo(f"📦 Using previously downloaded {asset_name}")
+    else:
+        click.echo(f"📦 Downloading Daemonswright {version} for {platform_name}...")
+        click.echo(f"   URL: {download_url}")
+        click.echo("")
 
-    except urllib.error.HTTPError as e:
-        click.echo(click.style(f"   ✗ Download failed: HTTP {e.code}", fg="red"))
-        if e.code == 404:
-            click.echo(f"   Release asset not found: {asset_name}")
-            click.echo("   Daemonswright binaries may not be published yet.")
-        return None
-    except Exception as e:
-        click.echo(click.style(f"   ✗ Download failed: {e}", fg="red"))
-        return None
+        try:
+            # Download with progress
+            last_drawn = 0.0
+
+            def reporthook(downloaded, total_size):
+                nonlocal last_drawn
+                if total_size > 0:
+                    # Redraw at most ~10 times a second, but always show 100%
+                    now = time.monotonic()
+                    if now - last_drawn < _PROGRESS_INTERVAL and downloaded < total_size:
+                        return
+                    last_drawn = now
+
+                    percent = min(100, (downloaded / total_size) * 100)
+                    bar_len = 40
+                    filled = int(bar_len * percent / 100)
+                    bar = "█" * filled + "░" * (bar_len - filled)
+                    click.echo(f"\r   [{bar}] {percent:.1f}%", nl=False)
+
+            # Stream in large chunks rather than urlretrieve's 8 KiB blocks
+            req = urllib.request.Request(download_url, headers={"User-Agent": "daemons-cli"})
+            with _urlopen(req, timeout=30) as response, open(
+                partial_path, "wb", buffering=_DOWNLOAD_CHUNK_SIZE
+            ) as archive:
+                total_size = int(response.headers.get("Content-Length") or 0)
+                downloaded = 0
+                while chunk := response.read(_DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+                    downloaded += len(chunk)
+                    reporthook(downloaded, total_size)
+
+            if downloaded < total_size:
+                raise urllib.error.ContentTooShortError(
+                    f"retrieval incomplete: got only {downloaded} out of {total_size} bytes",
+                    None,
+                )
+            # Only a complete download ever appears under the archive name
+            os.replace(partial_path, archive_path)
+            click.echo("")  # New line after progress bar
+            click.echo(click.style("   ✓ Download complete!", fg="green"))
+
+        except urllib.error.HTTPError as e:
+            click.echo(click.style(f"   ✗ Download failed: HTTP {e.code}", fg="red"))
+            if e.code == 404:
+                click.echo(f"   Release asset not found: {asset_name}")
+                click.echo("   Daemonswright binaries may not be published yet.")
+            return None
+        except Exception as e:
+            click.echo(click.style(f"   ✗ Download failed: {e}", fg="red"))
+            return None
 
     # Extract the archive
     click.echo("📂 Extracting...")
@@ -541,13 +829,19 @@ def _download_wright(version: str, cache_dir: Path) -> Path | None:
         extract_dir.mkdir(exist_ok=True)
 
         if archive_ext == ".zip":
-            with zipfile.ZipFile(archive_path, "r") as zf:
-                zf.extractall(extract_dir)
+            try:
+                _extract_zip(archive_path, extract_dir)
+            except (zipfile.BadZipFile, OSError):
+                # Otherwise every later run would fail on the same archive
+                archive_path.unlink(missing_ok=True)
+                raise
         elif archive_ext == ".AppImage":
             # AppImage is directly executable, just make it executable
             exe_path = version_dir / exe_name
-            shutil.move(archive_path, exe_path)
-            exe_path.chmod(exe_path.stat().st_mode | 0o755)
+            # Both paths are in the version dir, so this is a plain rename
+            os.replace(archive_path, exe_path)
+            os.chmod(exe_path, 0o755)
+            _remember_wright_exe(version_dir, exe_path)
             click.echo(click.style("   ✓ Ready!", fg="green"))
             return exe_path
         elif archive_ext == ".dmg":
@@ -558,13 +852,13 @@ def _download_wright(version: str, cache_dir: Path) -> Path | None:
 
         # Find the executable in the extracted files
         if sys.platform == "win32":
-            # Look for the .exe in extracted directory
-            for exe_path in extract_dir.rglob("*.exe"):
-                if "daemonswright" in exe_path.name.lower():
-                    click.echo(click.style("   ✓ Ready!", fg="green"))
-                    return exe_path
-            # Fallback: look for any .exe
-            for exe_path in extract_dir.rglob("*.exe"):
+            # Look for the .exe in extracted directory, falling back to any .exe
+            _, files = _scan_tree(str(extract_dir))
+            exes = [f for f in files if f.lower().endswith(".exe")]
+            named = [f for f in exes if "daemonswright" in os.path.basename(f).lower()]
+            if named or exes:
+                exe_path = extract_dir / (named or exes)[0]
+                _remember_wright_exe(version_dir, exe_path)
                 click.echo(click.style("   ✓ Ready!", fg="green"))
                 return exe_path
 
@@ -589,25 +883,34 @@ def _find_cached_wright() -> Path | None:
 
     _, _, exe_name = _get_platform_info()
 
+    with os.scandir(cache_dir) as entries:
+        version_dirs = sorted(
+            (Path(entry.path) for entry in entries if entry.is_dir()), reverse=True
+        )
+
     # Look for any version directory with an executable
-    for version_dir in sorted(cache_dir.iterdir(), reverse=True):
-        if version_dir.is_dir():
-            # Check extracted folder
-            extract_dir = version_dir / "extracted"
-            if extract_dir.exists():
-                if sys.platform == "win32":
-                    for exe_path in extract_dir.rglob("*.exe"):
-                        if exe_path.exists():
-                            return exe_path
-                else:
-                    exe_path = extract_dir / exe_name
+    for version_dir in version_dirs:
+        # Downloads record the executable's location; use it when present
+        exe_path = _cached_wright_exe(version_dir)
+        if exe_path:
+            return exe_path
+
+        # Older caches have no marker: check extracted folder
+        extract_dir = version_dir / "extracted"
+        if extract_dir.exists():
+            if sys.platform == "win32":
+                for exe_path in extract_dir.rglob("*.exe"):
                     if exe_path.exists():
                         return exe_path
+            else:
+                exe_path = extract_dir / exe_name
+                if exe_path.exists():
+                    return exe_path
 
-            # Check direct executable (AppImage)
-            exe_path = version_dir / exe_name
-            if exe_path.exists():
-                return exe_path
+        # Check direct executable (AppImage)
+        exe_path = version_dir / exe_name
+        if exe_path.exists():
+            return exe_path
 
     return None
 
@@ -636,7 +939,7 @@ def wright(world_data: str | None, update: bool, dev: bool):
     import subprocess
 
     # Check for local development mode first
-    wright_dir = Path(__file__).parent.parent.parent / "daemonswright"
+    wright_dir = _PKG_DIR.parent.parent / "daemonswright"
 
     if dev or (wright_dir.exists() and (wright_dir / "package.json").exists()):
         # Development mode: run from source
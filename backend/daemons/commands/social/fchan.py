@@ -60,12 +60,15 @@ class FactionChatCommand:
         faction_name = faction_info.name if faction_info else player.faction_id
         faction_color = faction_info.color if faction_info else "#FFFFFF"
 
-        # Find all online players in the same faction
-        faction_members = []
-        for pid, p in self.ctx.world.players.items():
-            # Check if player is online (has active listener)
-            if self.ctx.has_listener(pid) and p.faction_id == player.faction_id:
-                faction_members.append(pid)
+        # Find all online players in the same faction. Only players with an
+        # active listener can receive the message, so scan those rather than
+        # every character loaded into the world.
+        players = self.ctx.world.players
+        faction_members = [
+            pid
+            for pid in self.ctx.online_player_ids()
+            if (p := players.get(pid)) is not None and p.faction_id == player.faction_id
+        ]
 
         if not faction_members:
             return [
@@ -79,28 +82,21 @@ class FactionChatCommand:
 
         # Format: [Faction Name] PlayerName: message
         formatted_message = f"[{faction_name}] {player_name}: {message}"
-
-        # Send to all faction members
-        for member_id in faction_members:
-            if member_id == player_id:
-                # Echo to sender with "You say" format
-                sender_message = f"[{faction_name}] You: {message}"
-                events.append(
-                    self.ctx.msg_to_player(
-                        player_id,
-                        sender_message,
-                        payload={"type": "fchan", "color": faction_color},
-                    )
-                )
-            else:
-                # Send to other faction members
-                events.append(
-                    self.ctx.msg_to_player(
-                        member_id,
-                        formatted_message,
-                        payload={"type": "fchan", "color": faction_color},
-                    )
-                )
+        payload = {"type": "fchan", "color": faction_color}
+
+        if player_id in faction_members:
+            # Echo to sender with "You say" format
+            sender_message = f"[{faction_name}] You: {message}"
+            events.append(
+                self.ctx.msg_to_player(player_id, sender_message, payload=payload)
+            )
+
+        # Send to the other faction members as one multi-recipient event
+        others = [member_id for member_id in faction_members if member_id != player_id]
+        if others:
+            events.append(
+                self.ctx.msg_to_players(others, formatted_message, payload=payload)
+            )
 
         return events
 
@@ -117,11 +113,7 @@ def register_faction_chat_commands(router) -> None:
         handler = FactionChatCommand(engine.ctx)
         return handler.handle_fchan(player_id, player.name, args)
 
-    def cmd_fc(engine, player_id: str, args: str) -> list[Event]:
-        """Handle 'fc' command (alias for fchan)."""
-        return cmd_fchan(engine, player_id, args)
-
-    # Register both commands
+    # Register both commands; 'fc' shares the fchan handler directly
     router.register(
         names=["fchan"],
         description="Broadcast message to all faction members",
@@ -134,4 +126,4 @@ def register_faction_chat_commands(router) -> None:
         description="Broadcast message to all faction members (alias for fchan)",
         usage="fc <message>",
         category="social",
-    )(cmd_fc)
+    )(cmd_fchan)
@@ -36,12 +36,12 @@ Phase 14.3 additions:
 from __future__ import annotations
 
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from ..world import NpcTemplate, World, WorldNpc
+    from ..world import NpcTemplate, World, WorldEntity, WorldNpc
 
 
 # =============================================================================
@@ -108,6 +108,43 @@ class BehaviorContext:
             if eid in self.world.npcs and eid != self.npc.id
         ]
 
+    def iter_room_faction_allies(self, faction_id: str | None) -> Iterator[WorldEntity]:
+        """
+        Yield same-faction NPCs (excluding self), then players, in the NPC's room.
+
+        A faction_id of None matches everyone (NPCs without a loaded template
+        are skipped). Lazy, so callers that only need to know whether any ally is
+        present stop at the first one.
+        """
+        room = self.get_room()
+        # A lone NPC (the room holds only itself) has no allies to look up
+        if not room or (len(room.entities) <= 1 and self.npc.id in room.entities):
+            return
+
+        npcs = self.world.npcs
+        templates = self.world.npc_templates
+        for eid in room.entities:
+            other_npc = npcs.get(eid)
+            if other_npc is None or eid == self.npc.id:
+                continue
+            other_template = templates.get(other_npc.template_id)
+            if other_template and (
+                faction_id is None or other_template.faction_id == faction_id
+            ):
+                yield other_npc
+
+        players = self.world.players
+        for eid in room.entities:
+            player = players.get(eid)
+            if player is not None and (
+                faction_id is None or player.faction_id == faction_id
+            ):
+                yield player
+
+    def get_room_faction_allies(self, faction_id: str | None) -> list[WorldEntity]:
+        """Get same-faction NPCs (excluding self), then players, in the NPC's room."""
+        return list(self.iter_room_faction_allies(faction_id))
+
     # ========== Phase 14.3: Ability System Integration ==========
 
     def has_abilities(self) -> bool:
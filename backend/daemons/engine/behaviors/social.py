@@ -4,52 +4,27 @@ from .base import BehaviorContext, BehaviorResult, BehaviorScript, behavior
 
 
 @behavior(
-    name="social",
-    description="NPC alerts nearby allies when attacked (alias for calls_for_help)",
+    name="calls_for_help",
+    description="NPC alerts nearby allies when attacked",
     priority=55,  # Run early when damaged
     defaults={
         "calls_for_help": True,
         "help_radius": 1,  # How many rooms away to alert
     },
 )
-class Social(BehaviorScript):
+class CallsForHelp(BehaviorScript):
     async def on_damaged(
         self, ctx: BehaviorContext, attacker_id: str, damage: int
     ) -> BehaviorResult:
         if not ctx.config.get("calls_for_help", True):
             return BehaviorResult.nothing()
 
-        # Find allies in the same room (faction-aware, includes NPCs and players)
-        npc_faction = ctx.template.faction_id
-        allies = []
-        
-        # Check NPCs
-        for npc_id in ctx.get_npcs_in_room():
-            other_npc = ctx.world.npcs.get(npc_id)
-            if not other_npc:
-                continue
-            
-            other_template = ctx.world.npc_templates.get(other_npc.template_id)
-            if not other_template:
-                continue
-            
-            # Only call same-faction NPCs for help
-            # If this NPC has no faction, call everyone (backward compatibility)
-            if npc_faction is None or other_template.faction_id == npc_faction:
-                allies.append(npc_id)
-        
-        # Check players
-        for player_id in ctx.get_players_in_room():
-            player = ctx.world.players.get(player_id)
-            if not player:
-                continue
-            
-            # Only call same-faction players for help
-            # If this NPC has no faction, call everyone (backward compatibility)
-            if npc_faction is None or player.faction_id == npc_faction:
-                allies.append(player_id)
-        
-        if allies:
+        # Call for help if any ally is in the same room (faction-aware, includes
+        # NPCs and players); the first one found is enough.
+        # If this NPC has no faction, call everyone (backward compatibility)
+        allies = ctx.iter_room_faction_allies(ctx.template.faction_id)
+
+        if next(allies, None) is not None:
             return BehaviorResult(
                 handled=False,  # Don't prevent other responses
                 call_for_help=True,
@@ -60,59 +35,17 @@ class Social(BehaviorScript):
 
 
 @behavior(
-    name="calls_for_help",
-    description="NPC alerts nearby allies when attacked",
+    name="social",
+    description="NPC alerts nearby allies when attacked (alias for calls_for_help)",
     priority=55,  # Run early when damaged
     defaults={
         "calls_for_help": True,
         "help_radius": 1,  # How many rooms away to alert
     },
 )
-class CallsForHelp(BehaviorScript):
-    async def on_damaged(
-        self, ctx: BehaviorContext, attacker_id: str, damage: int
-    ) -> BehaviorResult:
-        if not ctx.config.get("calls_for_help", True):
-            return BehaviorResult.nothing()
-
-        # Find allies in the same room (faction-aware, includes NPCs and players)
-        npc_faction = ctx.template.faction_id
-        allies = []
-        
-        # Check NPCs
-        for npc_id in ctx.get_npcs_in_room():
-            other_npc = ctx.world.npcs.get(npc_id)
-            if not other_npc:
-                continue
-            
-            other_template = ctx.world.npc_templates.get(other_npc.template_id)
-            if not other_template:
-                continue
-            
-            # Only call same-faction NPCs for help
-            # If this NPC has no faction, call everyone (backward compatibility)
-            if npc_faction is None or other_template.faction_id == npc_faction:
-                allies.append(npc_id)
-        
-        # Check players
-        for player_id in ctx.get_players_in_room():
-            player = ctx.world.players.get(player_id)
-            if not player:
-                continue
-            
-            # Only call same-faction players for help
-            # If this NPC has no faction, call everyone (backward compatibility)
-            if npc_faction is None or player.faction_id == npc_faction:
-                allies.append(player_id)
-        
-        if allies:
-            return BehaviorResult(
-                handled=False,  # Don't prevent other responses
-                call_for_help=True,
-                message=f"{ctx.npc.name} cries out for help!",
-            )
-
-        return BehaviorResult.nothing()
+class Social(CallsForHelp):
+    # Same hook as calls_for_help, registered under the alias tag
+    pass
 
 
 @behavior(
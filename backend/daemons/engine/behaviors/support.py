@@ -9,9 +9,15 @@ These behaviors make NPCs intelligently support their faction allies:
 """
 import random
 
+from ..world import EntityType, WorldEntity
 from .base import BehaviorContext, BehaviorResult, BehaviorScript, behavior
 
 
+def _lower_hp_ratio(a: WorldEntity, b: WorldEntity) -> bool:
+    """Check whether a has a lower current/max HP ratio than b, without dividing."""
+    return a.current_health * b.max_health < b.current_health * a.max_health
+
+
 @behavior(
     name="healer",
     description="NPC heals faction allies when they're injured",
@@ -33,46 +39,36 @@ class Healer(BehaviorScript):
     3. Prioritizes lowest HP allies
     """
 
-    def _find_faction_allies(self, ctx: BehaviorContext) -> list[tuple[str, float]]:
+    def _find_heal_target(
+        self, ctx: BehaviorContext, heal_threshold: float, prefer_lowest_hp: bool
+    ) -> WorldEntity | None:
         """
-        Find same-faction entities (NPCs and players) in room and their HP percentages.
-        
+        Pick a same-faction entity (NPC or player) in room below heal_threshold HP%.
+
+        Walks the room's allies once, tracking the lowest-HP ally as it goes
+        (first one wins ties) or collecting the injured ones for a random pick.
+
         Returns:
-            List of (entity_id, hp_percent) tuples for faction allies
+            The ally to heal, or None if no faction ally needs healing
         """
         npc_faction = ctx.template.faction_id
         if not npc_faction:
-            return []
-        
-        allies = []
-        
-        # Check NPCs in room
-        for npc_id in ctx.get_npcs_in_room():
-            other_npc = ctx.world.npcs.get(npc_id)
-            if not other_npc:
-                continue
-            
-            other_template = ctx.world.npc_templates.get(other_npc.template_id)
-            if not other_template:
-                continue
-            
-            # Only consider same-faction NPCs
-            if other_template.faction_id == npc_faction:
-                hp_percent = (other_npc.current_health / other_npc.max_health) * 100
-                allies.append((npc_id, hp_percent))
-        
-        # Check players in room
-        for player_id in ctx.get_players_in_room():
-            player = ctx.world.players.get(player_id)
-            if not player:
+            return None
+
+        # HP ratios are compared by cross-multiplying, so no division is needed
+        target = None
+        injured_allies = []
+        for ally in ctx.iter_room_faction_allies(npc_faction):
+            if ally.current_health * 100 >= ally.max_health * heal_threshold:
                 continue
-            
-            # Only consider same-faction players
-            if player.faction_id == npc_faction:
-                hp_percent = (player.current_health / player.max_health) * 100
-                allies.append((player_id, hp_percent))
-        
-        return allies
+            if not prefer_lowest_hp:
+                injured_allies.append(ally)
+            elif target is None or _lower_hp_ratio(ally, target):
+                target = ally
+
+        if injured_allies:
+            target = random.choice(injured_allies)
+        return target
 
     async def on_combat_action(
         self, ctx: BehaviorContext, target_id: str
@@ -106,25 +102,17 @@ class Healer(BehaviorScript):
                 message=f"{ctx.npc.name} channels healing energy!",
             )
 
-        # Find faction allies who need healing
-        heal_threshold = ctx.config.get("heal_threshold", 70)
-        allies = self._find_faction_allies(ctx)
-        
-        # Filter to only allies below threshold
-        injured_allies = [(npc_id, hp) for npc_id, hp in allies if hp < heal_threshold]
-        
-        if not injured_allies:
+        # Find a faction ally who needs healing (lowest HP if configured)
+        target = self._find_heal_target(
+            ctx,
+            ctx.config.get("heal_threshold", 70),
+            ctx.config.get("prefer_lowest_hp", True),
+        )
+        if target is None:
             return BehaviorResult.nothing()
 
-        # Choose target (lowest HP if configured)
-        if ctx.config.get("prefer_lowest_hp", True):
-            target_id = min(injured_allies, key=lambda x: x[1])[0]
-        else:
-            target_id = random.choice(injured_allies)[0]
-
-        # Get target name for message
-        target = ctx.world.npcs.get(target_id) or ctx.world.players.get(target_id)
-        target_name = target.name if target else "ally"
+        target_id = target.id
+        target_name = target.name
 
         ability_id = random.choice(healing_ready)
         return BehaviorResult.use_ability(
@@ -154,48 +142,36 @@ class Buffer(BehaviorScript):
     3. Avoids wasting buffs on full-health/inactive allies
     """
 
-    def _find_faction_allies(self, ctx: BehaviorContext) -> list[tuple[str, float, bool]]:
+    def _find_buff_target(
+        self, ctx: BehaviorContext, prefer_damaged_allies: bool
+    ) -> WorldEntity | None:
         """
-        Find same-faction entities (NPCs and players) in room with health and combat status.
-        
+        Pick a same-faction entity (NPC or player) in room to buff.
+
+        With prefer_damaged_allies, this is the lowest-HP ally that is in
+        combat (first one wins ties); otherwise a random ally. Walks the
+        room's allies once either way.
+
         Returns:
-            List of (entity_id, hp_percent, in_combat) tuples
+            The ally to buff, or None if there is no suitable ally
         """
         npc_faction = ctx.template.faction_id
         if not npc_faction:
-            return []
-        
-        allies = []
-        
-        # Check NPCs in room
-        for npc_id in ctx.get_npcs_in_room():
-            other_npc = ctx.world.npcs.get(npc_id)
-            if not other_npc:
-                continue
-            
-            other_template = ctx.world.npc_templates.get(other_npc.template_id)
-            if not other_template:
-                continue
-            
-            # Only consider same-faction NPCs
-            if other_template.faction_id == npc_faction:
-                hp_percent = (other_npc.current_health / other_npc.max_health) * 100
-                in_combat = bool(other_npc.target_id)
-                allies.append((npc_id, hp_percent, in_combat))
-        
-        # Check players in room
-        for player_id in ctx.get_players_in_room():
-            player = ctx.world.players.get(player_id)
-            if not player:
-                continue
-            
-            # Only consider same-faction players
-            if player.faction_id == npc_faction:
-                hp_percent = (player.current_health / player.max_health) * 100
-                in_combat = bool(player.combat.is_in_combat())
-                allies.append((player_id, hp_percent, in_combat))
-        
-        return allies
+            return None
+
+        if not prefer_damaged_allies:
+            allies = ctx.get_room_faction_allies(npc_faction)
+            return random.choice(allies) if allies else None
+
+        target = None
+        for ally in ctx.iter_room_faction_allies(npc_faction):
+            if ally.entity_type == EntityType.NPC:
+                in_combat = bool(ally.target_id)
+            else:
+                in_combat = bool(ally.combat.is_in_combat())
+            if in_combat and (target is None or _lower_hp_ratio(ally, target)):
+                target = ally
+        return target
 
     async def on_combat_action(
         self, ctx: BehaviorContext, target_id: str
@@ -217,26 +193,15 @@ class Buffer(BehaviorScript):
         if not buff_ready:
             return BehaviorResult.nothing()
 
-        # Find faction allies
-        allies = self._find_faction_allies(ctx)
-        if not allies:
+        # Find a faction ally to buff (lowest HP ally in combat if configured)
+        target = self._find_buff_target(
+            ctx, ctx.config.get("prefer_damaged_allies", True)
+        )
+        if target is None:
             return BehaviorResult.nothing()
 
-        # Prefer allies in combat
-        if ctx.config.get("prefer_damaged_allies", True):
-            combat_allies = [(npc_id, hp, combat) for npc_id, hp, combat in allies if combat]
-            if combat_allies:
-                # Buff lowest HP ally in combat
-                target_id = min(combat_allies, key=lambda x: x[1])[0]
-            else:
-                return BehaviorResult.nothing()
-        else:
-            # Random ally
-            target_id = random.choice([npc_id for npc_id, _, _ in allies])
-
-        # Get target name for message
-        target = ctx.world.npcs.get(target_id) or ctx.world.players.get(target_id)
-        target_name = target.name if target else "ally"
+        target_id = target.id
+        target_name = target.name
 
         ability_id = random.choice(buff_ready)
         return BehaviorResult.use_ability(
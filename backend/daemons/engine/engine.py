@@ -2485,7 +2485,9 @@ class WorldEngine:
             from daemons.routes.admin import ContentReloader, ReloadContentType
 
             async with self._db_session_factory() as session:
-                reloader = ContentReloader(self, session)
+                reloader = ContentReloader(
+                    self, session, session_factory=self._db_session_factory
+                )
 
                 if content_type == "all":
                     results = await reloader.reload_all()
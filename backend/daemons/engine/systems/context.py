@@ -16,6 +16,8 @@ import asyncio
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import KeysView
+
     from ..world import PlayerId, RoomId, World
 
 
@@ -86,6 +88,24 @@ class GameContext:
             ev["payload"] = payload
         return ev
 
+    def msg_to_players(
+        self,
+        player_ids: list[PlayerId],
+        text: str,
+        *,
+        payload: dict | None = None,
+    ) -> Event:
+        """Create one message event delivered to each of several players."""
+        ev: Event = {
+            "type": "message",
+            "scope": "players",
+            "player_ids": list(player_ids),
+            "text": text,
+        }
+        if payload:
+            ev["payload"] = payload
+        return ev
+
     def msg_to_room(
         self,
         room_id: RoomId,
@@ -113,6 +133,7 @@ class GameContext:
 
         Handles:
         - player-scoped messages (direct to one player)
+        - players-scoped messages (same message to a list of players)
         - room-scoped messages (to all players in a room)
         - all-scoped messages (broadcast to everyone)
         """
@@ -124,6 +145,9 @@ class GameContext:
                 if player_id and player_id in self._listeners:
                     await self._listeners[player_id].put(ev)
 
+            elif scope == "players":
+                await self.deliver_to_players(ev)
+
             elif scope == "room":
                 room_id = ev.get("room_id")
                 exclude = set(ev.get("exclude", []))
@@ -140,6 +164,21 @@ class GameContext:
                     if player_id not in exclude:
                         await q.put(ev)
 
+    async def deliver_to_players(self, ev: Event) -> None:
+        """
+        Fan a players-scoped event out to each connected recipient.
+
+        Each player gets their own copy addressed by player_id, with the
+        engine-internal routing keys stripped.
+        """
+        wire_base = {
+            k: v for k, v in ev.items() if k not in ("scope", "exclude", "player_ids")
+        }
+        for player_id in ev.get("player_ids", ()):
+            q = self._listeners.get(player_id)
+            if q is not None:
+                await q.put({**wire_base, "player_id": player_id})
+
     # ---------- Player Listener Management ----------
 
     def register_listener(self, player_id: PlayerId) -> asyncio.Queue[Event]:
@@ -159,3 +198,7 @@ class GameContext:
     def get_listener(self, player_id: PlayerId) -> asyncio.Queue[Event] | None:
         """Get a player's event queue, or None if not registered."""
         return self._listeners.get(player_id)
+
+    def online_player_ids(self) -> KeysView[PlayerId]:
+        """Live view of the ids of players with an active listener."""
+        return self._listeners.keys()
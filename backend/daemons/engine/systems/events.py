@@ -28,7 +28,7 @@ class EventDispatcher:
     Manages event construction and routing to players.
 
     Features:
-    - Creates typed events with proper scope (player, room, all)
+    - Creates typed events with proper scope (player, players, room, all)
     - Routes events to appropriate player queues
     - Handles exclusions and payloads
     - Provides stat update emissions for UI sync
@@ -72,6 +72,26 @@ class EventDispatcher:
             ev["payload"] = payload
         return ev
 
+    def msg_to_players(
+        self,
+        player_ids: list[PlayerId],
+        text: str,
+        *,
+        payload: dict | None = None,
+    ) -> Event:
+        """
+        Create one message event delivered to each of several players.
+
+        Args:
+            player_ids: The players to send to
+            text: The message text (supports markdown)
+            payload: Optional additional data
+
+        Returns:
+            An event dict ready to dispatch
+        """
+        return self.ctx.msg_to_players(player_ids, text, payload=payload)
+
     def msg_to_room(
         self,
         room_id: RoomId,
@@ -165,6 +185,7 @@ class EventDispatcher:
 
         Handles:
         - player-scoped messages (direct to one player)
+        - players-scoped messages (same message to a list of players)
         - room-scoped messages (to all players in a room)
         - group-scoped messages (to all members in a group)
         - tell-scoped messages (to sender and recipient only)
@@ -192,6 +213,9 @@ class EventDispatcher:
                 }
                 await q.put(wire_event)
 
+            elif scope == "players":
+                await self.ctx.deliver_to_players(ev)
+
             elif scope == "room":
                 room_id = ev.get("room_id")
                 if not room_id:
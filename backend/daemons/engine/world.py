@@ -1,6 +1,7 @@
 # backend/app/engine/world.py
 from __future__ import annotations
 
+import sys
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
@@ -1503,6 +1504,11 @@ class NpcTemplate:
     # Resolved behavior config (populated at load time from behavior tags)
     resolved_behavior: dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        """Intern faction_id so per-tick faction comparisons compare by identity."""
+        if isinstance(self.faction_id, str):
+            self.faction_id = sys.intern(self.faction_id)
+
 
 @dataclass
 class WorldNpc(WorldEntity):
@@ -1717,6 +1723,9 @@ class WorldPlayer(WorldEntity):
     def __post_init__(self):
         """Ensure entity_type is set correctly."""
         object.__setattr__(self, "entity_type", EntityType.PLAYER)
+        # Interned so faction checks in behavior and chat loops compare by identity
+        if isinstance(self.faction_id, str):
+            self.faction_id = sys.intern(self.faction_id)
 
     def get_effective_armor_class(self) -> int:
         """
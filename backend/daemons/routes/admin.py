@@ -14,18 +14,26 @@ All endpoints require appropriate roles (MODERATOR, GAME_MASTER, or ADMIN).
 """
 
 import asyncio
+import contextlib
+import copy
+import mmap
+import os
+import threading
 import time
 import uuid
+from collections.abc import Callable, Iterator
 from dataclasses import asdict
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
+import yaml
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from daemons.db import get_session
+from daemons.db import AsyncSessionLocal, get_session
 from daemons.engine.systems.auth import (
     ROLE_PERMISSIONS,
     AuthSystem,
@@ -3867,6 +3875,17 @@ class ValidationResult(BaseModel):
     warnings: list[str] = []
 
 
+class ContentValidationResponse(BaseModel):
+    """Summary of a content validation run."""
+
+    success: bool
+    content_type: str
+    files_checked: int
+    files_valid: int
+    files_invalid: int
+    results: list[ValidationResult] = []
+
+
 class ReloadResult(BaseModel):
     """Result of a reload operation."""
 
@@ -3879,6 +3898,324 @@ class ReloadResult(BaseModel):
     warnings: list[str] = []
 
 
+# Required top-level fields for each content type. Tuples, not sets:
+# missing fields are reported in this order.
+_REQUIRED_AREA_FIELDS = ("id", "name")
+_REQUIRED_ROOM_FIELDS = ("id", "name", "description")
+_REQUIRED_ITEM_FIELDS = ("id", "name")
+_REQUIRED_NPC_FIELDS = ("id", "name")
+_REQUIRED_SPAWN_FIELDS = ("template_id", "room_id")
+
+_VALID_EXITS = frozenset({"north", "south", "east", "west", "up", "down"})
+_VALID_ITEM_TYPES = frozenset(
+    {"weapon", "armor", "consumable", "container", "misc", "quest", "tool"}
+)
+
+
+def _missing_fields(data: Any, required: tuple[str, ...]) -> list[str]:
+    """Return the required fields absent from data, in declaration order."""
+    return [field for field in required if field not in data]
+
+
+def _check_required_fields(
+    data: dict, required: tuple[str, ...], result: ValidationResult
+) -> None:
+    """Record an error for each required field missing from data, in order."""
+    missing = _missing_fields(data, required)
+    if missing:
+        result.is_valid = False
+        result.errors.extend(f"Missing required field: {field}" for field in missing)
+
+
+# Optional item template fields read from YAML and their defaults. Mutable
+# defaults (dicts/lists) are created per template in _item_template_kwargs.
+_ITEM_TEMPLATE_DEFAULTS: dict[str, Any] = {
+    "description": "",
+    "item_type": "misc",
+    "item_subtype": None,
+    "equipment_slot": None,
+    "weight": 0.0,
+    "max_stack_size": 1,
+    "has_durability": False,
+    "max_durability": None,
+    "is_container": False,
+    "container_capacity": None,
+    "container_type": None,
+    "is_consumable": False,
+    "consume_effect": None,
+    "flavor_text": None,
+    "rarity": "common",
+    "value": 0,
+    "damage_min": 0,
+    "damage_max": 0,
+    "attack_speed": 2.0,
+    "damage_type": "physical",
+}
+_ITEM_TEMPLATE_FIELDS = frozenset(_ITEM_TEMPLATE_DEFAULTS) | {
+    "id",
+    "name",
+    "stat_modifiers",
+    "flags",
+    "keywords",
+}
+
+# Optional NPC template fields read from YAML and their defaults
+_NPC_TEMPLATE_DEFAULTS: dict[str, Any] = {
+    "description": "",
+    "npc_type": "neutral",
+    "level": 1,
+    "max_health": 10,
+    "armor_class": 10,
+    "strength": 10,
+    "dexterity": 10,
+    "intelligence": 10,
+    "attack_damage_min": 1,
+    "attack_damage_max": 4,
+    "attack_speed": 1.0,
+    "experience_reward": 10,
+    "persist_state": False,
+    "class_id": None,
+    "is_fauna": False,
+    "faction_id": None,
+}
+_NPC_TEMPLATE_FIELDS = frozenset(_NPC_TEMPLATE_DEFAULTS) | {
+    "id",
+    "name",
+    "idle_messages",
+    "keywords",
+    "fauna_data",
+}
+
+
+def _item_template_kwargs(item_data: dict) -> dict[str, Any]:
+    """ItemTemplate keyword arguments: YAML values over defaults, unknown keys dropped."""
+    return {
+        **_ITEM_TEMPLATE_DEFAULTS,
+        "stat_modifiers": {},
+        "flags": {},
+        "keywords": [],
+        **{k: v for k, v in item_data.items() if k in _ITEM_TEMPLATE_FIELDS},
+    }
+
+
+def _npc_template_kwargs(npc_data: dict) -> dict[str, Any]:
+    """
+    NpcTemplate keyword arguments: YAML values over defaults, unknown keys dropped.
+
+    Mirrors the startup loader: YAML `behavior` is a list of tags (or a legacy
+    raw config dict) and `loot_table` becomes the runtime `drop_table`.
+    """
+    from daemons.engine.behaviors import resolve_behaviors
+
+    raw_behavior = npc_data.get("behavior") or []
+    if isinstance(raw_behavior, list):
+        behavior_tags = raw_behavior
+        resolved = resolve_behaviors(behavior_tags)
+    else:
+        behavior_tags = []
+        resolved = raw_behavior
+
+    return {
+        **_NPC_TEMPLATE_DEFAULTS,
+        "idle_messages": [],
+        "keywords": [],
+        "fauna_data": {},
+        **{k: v for k, v in npc_data.items() if k in _NPC_TEMPLATE_FIELDS},
+        "behaviors": behavior_tags,
+        "resolved_behavior": resolved,
+        "drop_table": npc_data.get("loot_table") or [],
+        "default_abilities": set(npc_data.get("default_abilities") or []),
+        "ability_loadout": list(npc_data.get("ability_loadout") or []),
+    }
+
+
+# NPC spawn files at least this large are validated from the YAML event
+# stream instead of being loaded into a full document tree
+_STREAM_VALIDATE_MIN_BYTES = 256 * 1024
+
+# Parsed YAML documents keyed by file path. An entry is reused as long as
+# the file's (mtime_ns, size) is unchanged, so repeated reloads only pay the
+# parse cost for files that were actually edited. Entries are kept in
+# least-recently-used order; the lock guards it against the loader threads.
+_YAML_CACHE_MAX_ENTRIES = 4096
+_yaml_cache: dict[str, tuple[int, int, Any]] = {}
+_yaml_cache_lock = threading.Lock()
+
+# Files and directories modified this recently are not trusted for caching:
+# filesystem timestamps are coarse, so a second change could land on the
+# same mtime.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Files at least this large are parsed from a read-only memory map
+_YAML_MMAP_MIN_BYTES = 64 * 1024
+
+# libyaml-backed loader when available, pure-Python fallback otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _StreamFallback(Exception):
+    """A spawn file needs the full document tree to be validated."""
+
+
+@contextlib.contextmanager
+def _open_yaml_source(file_path: Path, size: int) -> Iterator[Any]:
+    """
+    Yield a file's contents for the YAML parser.
+
+    Raw bytes are handed over (the parser detects UTF-8 itself) rather than
+    decoded str; large files are memory-mapped instead of copied.
+    """
+    if size >= _YAML_MMAP_MIN_BYTES:
+        with (
+            open(file_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            yield mapped
+    else:
+        yield file_path.read_bytes()
+
+
+def _load_yaml_cached(file_path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the cached result if it has not changed.
+
+    Callers get their own deep copy, which is far cheaper than parsing, so
+    templates built from it never share lists or dicts with the cache or
+    with each other. Files modified within the last couple of seconds are
+    parsed but not cached.
+    """
+    stat = file_path.stat()
+    key = str(file_path)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.pop(key, None)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            # Re-insert to mark the entry as most recently used
+            _yaml_cache[key] = cached
+            return copy.deepcopy(cached[2])
+
+    with _open_yaml_source(file_path, stat.st_size) as source:
+        data = yaml.load(source, Loader=_YamlLoader)
+
+    # A same-size edit within one mtime tick would look unchanged
+    if time.time_ns() - stat.st_mtime_ns < _RACY_MTIME_WINDOW_NS:
+        return data
+
+    with _yaml_cache_lock:
+        # Evict the least recently used entry once the cache is full
+        _yaml_cache.pop(key, None)
+        if len(_yaml_cache) >= _YAML_CACHE_MAX_ENTRIES:
+            del _yaml_cache[next(iter(_yaml_cache))]
+        _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
+# Recursive *.yaml listings keyed by root directory. Each entry records the
+# mtime of every directory visited; creating, deleting or renaming a file
+# bumps its parent's mtime, so a listing stays valid while they all match.
+_yaml_listing_cache: dict[str, tuple[dict[str, int], list[Path]]] = {}
+
+
+def _walk_yaml(root: Path) -> list[Path]:
+    """
+    List all *.yaml files under root (recursively).
+
+    Uses an explicit os.scandir stack instead of Path.glob("**/*.yaml") and
+    memoizes the result, so an unchanged tree costs one stat per directory.
+    Returns an empty list if root does not exist.
+    """
+    key = str(root)
+    cached = _yaml_listing_cache.get(key)
+    if cached is not None:
+        dir_mtimes, files = cached
+        try:
+            if all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items()):
+                return list(files)
+        except OSError:
+            pass
+
+    dir_mtimes = {}
+    files = []
+    stack = [key]
+    while stack:
+        current = stack.pop()
+        try:
+            # Stat before listing so a concurrent change invalidates the entry
+            dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Symlinked directories are not descended into, so a
+                    # link cycle can't list files twice or loop forever
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".yaml"):
+                        files.append(Path(entry.path))
+        except OSError:
+            dir_mtimes.pop(current, None)
+
+    if dir_mtimes and (
+        max(dir_mtimes.values()) < time.time_ns() - _RACY_MTIME_WINDOW_NS
+    ):
+        _yaml_listing_cache[key] = (dir_mtimes, files)
+    return list(files)
+
+
+def _build_item_template(yaml_file: Path) -> Any:
+    """
+    Read, parse and construct one item template in a single worker call.
+
+    Returns None when the file has no `id`, so the caller can report it.
+    """
+    from daemons.engine.world import ItemTemplate as WorldItemTemplate
+
+    item_data = _load_yaml_cached(yaml_file)
+    if not item_data or "id" not in item_data:
+        return None
+    return WorldItemTemplate(**_item_template_kwargs(item_data))
+
+
+def _build_npc_template(yaml_file: Path) -> Any:
+    """
+    Read, parse and construct one NPC template in a single worker call.
+
+    Returns None when the file has no `id`, so the caller can report it.
+    """
+    from daemons.engine.world import NpcTemplate as WorldNpcTemplate
+
+    npc_data = _load_yaml_cached(yaml_file)
+    if not npc_data or "id" not in npc_data:
+        return None
+    return WorldNpcTemplate(**_npc_template_kwargs(npc_data))
+
+
+async def _load_yaml_files(
+    yaml_files: list[Path],
+    depth: int = 32,
+    loader: Callable[[Path], Any] = _load_yaml_cached,
+) -> list[tuple[Path, Any]]:
+    """
+    Read and parse YAML files in worker threads, keeping up to `depth` in flight.
+
+    Overlaps disk reads with parsing instead of serializing them. Returns
+    (path, data) pairs in input order; a file that failed to load has its
+    exception in place of the data. Pass `loader` to do more per-file work
+    (such as building templates) in the same worker call.
+    """
+    semaphore = asyncio.Semaphore(depth)
+
+    async def load_one(yaml_file: Path) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(loader, yaml_file)
+
+    loaded = await asyncio.gather(
+        *(load_one(yaml_file) for yaml_file in yaml_files), return_exceptions=True
+    )
+    return list(zip(yaml_files, loaded, strict=True))
+
+
 class ContentReloader:
     """
     Handles hot-reloading of YAML content into the game world.
@@ -3890,58 +4227,84 @@ class ContentReloader:
     - Validate YAML before applying changes
     """
 
-    def __init__(self, engine, session: AsyncSession):
+    def __init__(
+        self,
+        engine,
+        session: AsyncSession,
+        session_factory: Callable[[], Any] | None = None,
+    ):
         self.engine = engine
         self.world = engine.world
         self.session = session
+        # Opens the session a shared reload_all pass runs on (see reload_all)
+        self.session_factory = session_factory
         self.world_data_dir = Path(__file__).parent.parent / "world_data"
 
     async def validate_yaml_file(
         self, file_path: Path, content_type: ReloadContentType
     ) -> ValidationResult:
         """Validate a YAML file without loading it."""
-        import yaml
+        return await asyncio.to_thread(
+            self._validate_yaml_file_sync, file_path, content_type
+        )
+
+    def _validate_yaml_file_sync(
+        self, file_path: Path, content_type: ReloadContentType
+    ) -> ValidationResult:
+        """
+        Blocking half of validate_yaml_file (file I/O, YAML parse, checks).
 
+        Safe to run in a worker thread: it only reads the file and never
+        touches world state.
+        """
         result = ValidationResult(file_path=str(file_path), is_valid=True)
 
-        if not file_path.exists():
+        # One stat both checks existence and sizes the file
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             result.is_valid = False
             result.errors.append(f"File not found: {file_path}")
             return result
+        except OSError as e:
+            result.is_valid = False
+            result.errors.append(f"Cannot read file: {e}")
+            return result
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if data is None:
-                result.is_valid = False
-                result.errors.append("Empty or invalid YAML file")
-                return result
-
-            # Validate based on content type
-            if content_type == ReloadContentType.AREAS:
-                result = self._validate_area_data(data, result)
-            elif content_type == ReloadContentType.ROOMS:
-                result = self._validate_room_data(data, result)
-            elif content_type in (
-                ReloadContentType.ITEMS,
-                ReloadContentType.ITEM_TEMPLATES,
-            ):
-                result = self._validate_item_template_data(data, result)
-            elif content_type in (
-                ReloadContentType.NPCS,
-                ReloadContentType.NPC_TEMPLATES,
+            # Large spawn files are checked from the event stream so the
+            # whole document tree never has to be built in memory
+            if (
+                content_type == ReloadContentType.NPC_SPAWNS
+                and file_size >= _STREAM_VALIDATE_MIN_BYTES
             ):
-                result = self._validate_npc_template_data(data, result)
-            elif content_type == ReloadContentType.NPC_SPAWNS:
-                result = self._validate_npc_spawn_data(data, result)
+                streamed = self._validate_npc_spawn_stream(file_path, result)
+                if streamed is not None:
+                    return streamed
 
+            data = _load_yaml_cached(file_path)
         except yaml.YAMLError as e:
             result.is_valid = False
             result.errors.append(f"YAML parse error: {e}")
-        except Exception as e:
+            return result
+        except OSError as e:
+            result.is_valid = False
+            result.errors.append(f"Cannot read file: {e}")
+            return result
+
+        if data is None:
             result.is_valid = False
-            result.errors.append(f"Validation error: {e}")
+            result.errors.append("Empty or invalid YAML file")
+            return result
+
+        # Validate based on content type
+        validator = self._VALIDATORS.get(content_type)
+        if validator is not None:
+            try:
+                result = validator(self, data, result)
+            except Exception as e:
+                result.is_valid = False
+                result.errors.append(f"Validation error: {e}")
 
         return result
 
@@ -3949,11 +4312,7 @@ class ContentReloader:
         self, data: dict, result: ValidationResult
     ) -> ValidationResult:
         """Validate area YAML data."""
-        required_fields = ["id", "name"]
-        for field in required_fields:
-            if field not in data:
-                result.is_valid = False
-                result.errors.append(f"Missing required field: {field}")
+        _check_required_fields(data, _REQUIRED_AREA_FIELDS, result)
 
         if "time_scale" in data:
             if (
@@ -3968,16 +4327,11 @@ class ContentReloader:
         self, data: dict, result: ValidationResult
     ) -> ValidationResult:
         """Validate room YAML data."""
-        required_fields = ["id", "name", "description"]
-        for field in required_fields:
-            if field not in data:
-                result.is_valid = False
-                result.errors.append(f"Missing required field: {field}")
+        _check_required_fields(data, _REQUIRED_ROOM_FIELDS, result)
 
         if "exits" in data:
-            valid_exits = {"north", "south", "east", "west", "up", "down"}
             for exit_dir in data["exits"]:
-                if exit_dir not in valid_exits:
+                if exit_dir not in _VALID_EXITS:
                     result.warnings.append(f"Non-standard exit direction: {exit_dir}")
 
         return result
@@ -3986,22 +4340,9 @@ class ContentReloader:
         self, data: dict, result: ValidationResult
     ) -> ValidationResult:
         """Validate item template YAML data."""
-        required_fields = ["id", "name"]
-        for field in required_fields:
-            if field not in data:
-                result.is_valid = False
-                result.errors.append(f"Missing required field: {field}")
-
-        valid_item_types = {
-            "weapon",
-            "armor",
-            "consumable",
-            "container",
-            "misc",
-            "quest",
-            "tool",
-        }
-        if "item_type" in data and data["item_type"] not in valid_item_types:
+        _check_required_fields(data, _REQUIRED_ITEM_FIELDS, result)
+
+        if "item_type" in data and data["item_type"] not in _VALID_ITEM_TYPES:
             result.warnings.append(f"Unknown item_type: {data['item_type']}")
 
         return result
@@ -4010,11 +4351,7 @@ class ContentReloader:
         self, data: dict, result: ValidationResult
     ) -> ValidationResult:
         """Validate NPC template YAML data."""
-        required_fields = ["id", "name"]
-        for field in required_fields:
-            if field not in data:
-                result.is_valid = False
-                result.errors.append(f"Missing required field: {field}")
+        _check_required_fields(data, _REQUIRED_NPC_FIELDS, result)
 
         if "max_health" in data and (
             not isinstance(data["max_health"], int) or data["max_health"] <= 0
@@ -4034,23 +4371,152 @@ class ContentReloader:
             return result
 
         for i, spawn in enumerate(data["spawns"]):
-            if "template_id" not in spawn:
-                result.errors.append(f"Spawn {i}: missing template_id")
+            missing = _missing_fields(spawn, _REQUIRED_SPAWN_FIELDS)
+            if missing:
                 result.is_valid = False
-            if "room_id" not in spawn:
-                result.errors.append(f"Spawn {i}: missing room_id")
+                result.errors.extend(f"Spawn {i}: missing {field}" for field in missing)
+
+        return result
+
+    def _validate_npc_spawn_stream(
+        self, file_path: Path, result: ValidationResult
+    ) -> ValidationResult | None:
+        """
+        Validate an NPC spawn file from YAML parse events.
+
+        Equivalent to _validate_npc_spawn_data, but only tracks the keys of
+        the spawn entry currently open, so memory stays O(entry) instead of
+        O(file). Only a mapping whose 'spawns' is a list of mappings, with
+        no aliases, merge keys, explicit tags or complex keys, is checked
+        this way. Anything else records nothing and returns None, so the
+        caller validates the full load instead. Raises yaml.YAMLError on
+        malformed input, likewise with nothing recorded.
+        """
+        errors_before = len(result.errors)
+        was_valid = result.is_valid
+        # One frame per open collection: [role, is_mapping, child_count,
+        # last_key, keys_seen]. Roles: "root", "spawns", "spawn", "other".
+        stack: list[list] = []
+        root_mark = None
+        spawns_found = False
+        spawn_count = 0
+
+        def check_spawn(index: int, keys: set[str]) -> None:
+            missing = _missing_fields(keys, _REQUIRED_SPAWN_FIELDS)
+            if missing:
                 result.is_valid = False
+                result.errors.extend(
+                    f"Spawn {index}: missing {field}" for field in missing
+                )
+
+        def open_node(event) -> str:
+            """Register a new node with its parent; return the node's role."""
+            nonlocal root_mark, spawns_found, spawn_count
+            if event.tag is not None:
+                raise _StreamFallback
+            if not stack:
+                if not isinstance(event, yaml.MappingStartEvent):
+                    raise _StreamFallback
+                root_mark = event.start_mark
+                return "root"
+
+            parent = stack[-1]
+            position = parent[2]
+            parent[2] += 1
+            if parent[1] and position % 2 == 0:
+                # Mapping key
+                if not isinstance(event, yaml.ScalarEvent) or event.value == "<<":
+                    raise _StreamFallback
+                key = parent[3] = event.value
+                if parent[0] == "root" and key == "spawns":
+                    if spawns_found:
+                        raise _StreamFallback
+                    spawns_found = True
+                elif parent[0] == "spawn":
+                    parent[4].add(key)
+                return "other"
+
+            if parent[0] == "root" and parent[3] == "spawns":
+                if not isinstance(event, yaml.SequenceStartEvent):
+                    raise _StreamFallback
+                return "spawns"
+
+            if parent[0] == "spawns":
+                if not isinstance(event, yaml.MappingStartEvent):
+                    raise _StreamFallback
+                spawn_count += 1
+                return "spawn"
+            return "other"
+
+        try:
+            with _open_yaml_source(file_path, file_path.stat().st_size) as source:
+                for event in yaml.parse(source, Loader=_YamlLoader):
+                    if isinstance(event, yaml.AliasEvent):
+                        raise _StreamFallback
+                    if isinstance(event, yaml.ScalarEvent):
+                        open_node(event)
+                    elif isinstance(event, yaml.CollectionStartEvent):
+                        role = open_node(event)
+                        is_mapping = isinstance(event, yaml.MappingStartEvent)
+                        keys = set() if role == "spawn" else None
+                        stack.append([role, is_mapping, 0, None, keys])
+                    elif isinstance(event, yaml.CollectionEndEvent):
+                        frame = stack.pop()
+                        if frame[0] == "spawn":
+                            check_spawn(spawn_count - 1, frame[4])
+                    elif (
+                        isinstance(event, yaml.DocumentStartEvent)
+                        and root_mark is not None
+                    ):
+                        # Same error the loader raises for a second document
+                        raise yaml.composer.ComposerError(
+                            "expected a single document in the stream",
+                            root_mark,
+                            "but found another document",
+                            event.start_mark,
+                        )
+        except (_StreamFallback, yaml.YAMLError) as e:
+            del result.errors[errors_before:]
+            result.is_valid = was_valid
+            if isinstance(e, _StreamFallback):
+                return None
+            raise
+
+        if root_mark is None:
+            result.is_valid = False
+            result.errors.append("Empty or invalid YAML file")
+        elif not spawns_found:
+            result.is_valid = False
+            result.errors.append("Missing 'spawns' list")
 
         return result
 
+    # Validator for each content type; aliased types share a handler
+    _VALIDATORS = {
+        ReloadContentType.AREAS: _validate_area_data,
+        ReloadContentType.ROOMS: _validate_room_data,
+        ReloadContentType.ITEMS: _validate_item_template_data,
+        ReloadContentType.ITEM_TEMPLATES: _validate_item_template_data,
+        ReloadContentType.NPCS: _validate_npc_template_data,
+        ReloadContentType.NPC_TEMPLATES: _validate_npc_template_data,
+        ReloadContentType.NPC_SPAWNS: _validate_npc_spawn_data,
+    }
+
+    # world_data subdirectory validated for each content type
+    _CONTENT_DIRS = {
+        ReloadContentType.AREAS: "areas",
+        ReloadContentType.ROOMS: "rooms",
+        ReloadContentType.ITEMS: "items",
+        ReloadContentType.ITEM_TEMPLATES: "items",
+        ReloadContentType.NPCS: "npcs",
+        ReloadContentType.NPC_TEMPLATES: "npcs",
+        ReloadContentType.NPC_SPAWNS: "npc_spawns",
+    }
+
     async def reload_item_templates(
         self, file_path: Path | None = None
     ) -> ReloadResult:
         """Reload item templates from YAML files."""
-        import yaml
-
-        from daemons.engine.world import ItemTemplate as WorldItemTemplate
-
         items_dir = self.world_data_dir / "items"
         result = ReloadResult(
             success=True,
@@ -4063,62 +4529,38 @@ class ContentReloader:
         if file_path:
             yaml_files = [file_path] if file_path.exists() else []
         else:
-            yaml_files = list(items_dir.glob("**/*.yaml")) if items_dir.exists() else []
+            yaml_files = _walk_yaml(items_dir)
 
-        for yaml_file in yaml_files:
-            # Skip schema files
-            if yaml_file.name.startswith("_"):
-                continue
-
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    item_data = yaml.safe_load(f)
+        # Skip schema files
+        yaml_files = [f for f in yaml_files if not f.name.startswith("_")]
 
-                if not item_data or "id" not in item_data:
-                    result.errors.append(f"{yaml_file}: Missing 'id' field")
-                    result.items_failed += 1
-                    continue
+        # Templates are built in the workers; only the dict update runs here.
+        # Updates go into a copy that is swapped in whole, so readers never
+        # see a half-reloaded set.
+        item_templates = dict(self.world.item_templates)
+        for yaml_file, template in await _load_yaml_files(
+            yaml_files, loader=_build_item_template
+        ):
+            if isinstance(template, Exception):
+                result.errors.append(f"{yaml_file}: {template}")
+                result.items_failed += 1
+                continue
 
-                # Update in-memory world
-                template = WorldItemTemplate(
-                    id=item_data["id"],
-                    name=item_data["name"],
-                    description=item_data.get("description", ""),
-                    item_type=item_data.get("item_type", "misc"),
-                    item_subtype=item_data.get("item_subtype"),
-                    equipment_slot=item_data.get("equipment_slot"),
-                    stat_modifiers=item_data.get("stat_modifiers", {}),
-                    weight=item_data.get("weight", 0.0),
-                    max_stack_size=item_data.get("max_stack_size", 1),
-                    has_durability=item_data.get("has_durability", False),
-                    max_durability=item_data.get("max_durability"),
-                    is_container=item_data.get("is_container", False),
-                    container_capacity=item_data.get("container_capacity"),
-                    container_type=item_data.get("container_type"),
-                    is_consumable=item_data.get("is_consumable", False),
-                    consume_effect=item_data.get("consume_effect"),
-                    flavor_text=item_data.get("flavor_text"),
-                    rarity=item_data.get("rarity", "common"),
-                    value=item_data.get("value", 0),
-                    flags=item_data.get("flags", {}),
-                    keywords=item_data.get("keywords", []),
-                    damage_min=item_data.get("damage_min", 0),
-                    damage_max=item_data.get("damage_max", 0),
-                    attack_speed=item_data.get("attack_speed", 2.0),
-                    damage_type=item_data.get("damage_type", "physical"),
-                )
+            if template is None:
+                result.errors.append(f"{yaml_file}: Missing 'id' field")
+                result.items_failed += 1
+                continue
 
-                is_update = item_data["id"] in self.world.item_templates
-                self.world.item_templates[item_data["id"]] = template
+            # Update in-memory world
+            is_update = template.id in item_templates
+            item_templates[template.id] = template
 
-                if is_update:
-                    result.items_updated += 1
-                else:
-                    result.items_loaded += 1
+            if is_update:
+                result.items_updated += 1
+            else:
+                result.items_loaded += 1
 
-            except Exception as e:
-                result.errors.append(f"{yaml_file}: {e}")
-                result.items_failed += 1
+        self.world.item_templates = item_templates
 
         if result.items_failed > 0:
             result.success = False
@@ -4127,11 +4569,6 @@ class ContentReloader:
 
     async def reload_npc_templates(self, file_path: Path | None = None) -> ReloadResult:
         """Reload NPC templates from YAML files."""
-        import yaml
-
-        from daemons.engine.behaviors import resolve_behaviors
-        from daemons.engine.world import NpcTemplate as WorldNpcTemplate
-
         npcs_dir = self.world_data_dir / "npcs"
         result = ReloadResult(
             success=True,
@@ -4144,60 +4581,40 @@ class ContentReloader:
         if file_path:
             yaml_files = [file_path] if file_path.exists() else []
         else:
-            yaml_files = list(npcs_dir.glob("**/*.yaml")) if npcs_dir.exists() else []
+            yaml_files = _walk_yaml(npcs_dir)
 
-        for yaml_file in yaml_files:
-            # Skip schema files
-            if yaml_file.name.startswith("_"):
+        # Skip schema files
+        yaml_files = [f for f in yaml_files if not f.name.startswith("_")]
+
+        # Templates are built in the workers; only the dict update runs here.
+        # Updates go into a copy that is swapped in whole, so readers never
+        # see a half-reloaded set.
+        npc_templates = dict(self.world.npc_templates)
+        for yaml_file, template in await _load_yaml_files(
+            yaml_files, loader=_build_npc_template
+        ):
+            if isinstance(template, Exception):
+                result.errors.append(f"{yaml_file}: {template}")
+                result.items_failed += 1
                 continue
 
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    npc_data = yaml.safe_load(f)
+            if template is None:
+                result.errors.append(f"{yaml_file}: Missing 'id' field")
+                result.items_failed += 1
+                continue
 
-                if not npc_data or "id" not in npc_data:
-                    result.errors.append(f"{yaml_file}: Missing 'id' field")
-                    result.items_failed += 1
-                    continue
+            is_update = template.id in npc_templates
+            npc_templates[template.id] = template
 
-                behavior_config = npc_data.get("behavior", {})
-                behaviors = resolve_behaviors(behavior_config)
-
-                template = WorldNpcTemplate(
-                    id=npc_data["id"],
-                    name=npc_data["name"],
-                    description=npc_data.get("description", ""),
-                    npc_type=npc_data.get("npc_type", "neutral"),
-                    level=npc_data.get("level", 1),
-                    max_health=npc_data.get("max_health", 10),
-                    armor_class=npc_data.get("armor_class", 10),
-                    strength=npc_data.get("strength", 10),
-                    dexterity=npc_data.get("dexterity", 10),
-                    intelligence=npc_data.get("intelligence", 10),
-                    attack_damage_min=npc_data.get("attack_damage_min", 1),
-                    attack_damage_max=npc_data.get("attack_damage_max", 4),
-                    attack_speed=npc_data.get("attack_speed", 1.0),
-                    experience_reward=npc_data.get("experience_reward", 10),
-                    behaviors=behaviors,
-                    idle_messages=npc_data.get("idle_messages", []),
-                    keywords=npc_data.get("keywords", []),
-                    loot_table=npc_data.get("loot_table", []),
+            if is_update:
+                result.items_updated += 1
+                result.warnings.append(
+                    f"Updated template: {template.id} (existing NPCs unchanged)"
                 )
+            else:
+                result.items_loaded += 1
 
-                is_update = npc_data["id"] in self.world.npc_templates
-                self.world.npc_templates[npc_data["id"]] = template
-
-                if is_update:
-                    result.items_updated += 1
-                    result.warnings.append(
-                        f"Updated template: {npc_data['id']} (existing NPCs unchanged)"
-                    )
-                else:
-                    result.items_loaded += 1
-
-            except Exception as e:
-                result.errors.append(f"{yaml_file}: {e}")
-                result.items_failed += 1
+        self.world.npc_templates = npc_templates
 
         if result.items_failed > 0:
             result.success = False
@@ -4214,8 +4631,6 @@ class ContentReloader:
         - Creates NEW rooms in both database and memory
         - Rooms with yaml_managed=False (API-modified) are skipped unless force=True.
         """
-        import yaml
-
         from daemons.models import Room as RoomModel
         from daemons.engine.world import WorldRoom
 
@@ -4231,19 +4646,20 @@ class ContentReloader:
         if file_path:
             yaml_files = [file_path] if file_path.exists() else []
         else:
-            yaml_files = list(rooms_dir.glob("**/*.yaml")) if rooms_dir.exists() else []
+            yaml_files = _walk_yaml(rooms_dir)
 
         skipped_rooms = []
 
-        for yaml_file in yaml_files:
-            # Skip schema and layout files
-            if yaml_file.name.startswith("_"):
+        # Skip schema and layout files
+        yaml_files = [f for f in yaml_files if not f.name.startswith("_")]
+
+        for yaml_file, room_data in await _load_yaml_files(yaml_files):
+            if isinstance(room_data, Exception):
+                result.errors.append(f"{yaml_file}: {room_data}")
+                result.items_failed += 1
                 continue
 
             try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    room_data = yaml.safe_load(f)
-
                 if not room_data or "id" not in room_data:
                     result.errors.append(f"{yaml_file}: Missing 'id' field")
                     result.items_failed += 1
@@ -4268,13 +4684,13 @@ class ContentReloader:
                     existing_room.lighting_override = room_data.get("lighting_override")
                     existing_room.temperature_override = room_data.get("temperature_override")
 
-                    # Update exits
-                    exits = room_data.get("exits", {})
-                    for direction in ("north", "south", "east", "west", "up", "down"):
-                        if direction in exits:
-                            existing_room.exits[direction] = exits[direction]
-                        elif direction in existing_room.exits:
-                            del existing_room.exits[direction]
+                    # Replace exits with the YAML ones
+                    exits = room_data.get("exits") or {}
+                    existing_room.exits = {
+                        direction: target
+                        for direction, target in exits.items()
+                        if direction in _VALID_EXITS
+                    }
 
                     result.items_updated += 1
                 else:
@@ -4351,8 +4767,6 @@ class ContentReloader:
         - Updates existing areas in memory
         - Creates NEW areas in both database and memory
         """
-        import yaml
-
         from daemons.models import Area as AreaModel
         from daemons.engine.world import WorldArea, WorldTime
 
@@ -4368,17 +4782,18 @@ class ContentReloader:
         if file_path:
             yaml_files = [file_path] if file_path.exists() else []
         else:
-            yaml_files = list(areas_dir.glob("**/*.yaml")) if areas_dir.exists() else []
+            yaml_files = _walk_yaml(areas_dir)
 
-        for yaml_file in yaml_files:
-            # Skip schema files
-            if yaml_file.name.startswith("_"):
+        # Skip schema files
+        yaml_files = [f for f in yaml_files if not f.name.startswith("_")]
+
+        for yaml_file, area_data in await _load_yaml_files(yaml_files):
+            if isinstance(area_data, Exception):
+                result.errors.append(f"{yaml_file}: {area_data}")
+                result.items_failed += 1
                 continue
 
             try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    area_data = yaml.safe_load(f)
-
                 if not area_data or "id" not in area_data:
                     result.errors.append(f"{yaml_file}: Missing 'id' field")
                     result.items_failed += 1
@@ -4491,7 +4906,7 @@ class ContentReloader:
         if not instances_dir.exists():
             return result
 
-        yaml_files = list(instances_dir.glob("**/*.yaml"))
+        yaml_files = _walk_yaml(instances_dir)
 
         for yaml_file in yaml_files:
             # Skip schema files
@@ -4614,7 +5029,7 @@ class ContentReloader:
         if not spawns_dir.exists():
             return result
 
-        yaml_files = list(spawns_dir.glob("**/*.yaml"))
+        yaml_files = _walk_yaml(spawns_dir)
 
         for yaml_file in yaml_files:
             # Skip schema files
@@ -4742,7 +5157,7 @@ class ContentReloader:
         biomes_dir = self.world_data_dir / "biomes"
         biome_defs = {}
         if biomes_dir.exists():
-            for yaml_file in biomes_dir.glob("**/*.yaml"):
+            for yaml_file in _walk_yaml(biomes_dir):
                 if yaml_file.name.startswith("_"):
                     continue
                 try:
@@ -4757,7 +5172,7 @@ class ContentReloader:
         flora_dir = self.world_data_dir / "flora"
         flora_templates = {}
         if flora_dir.exists():
-            for yaml_file in flora_dir.glob("**/*.yaml"):
+            for yaml_file in _walk_yaml(flora_dir):
                 if yaml_file.name.startswith("_"):
                     continue
                 try:
@@ -4873,7 +5288,7 @@ class ContentReloader:
         biomes_dir = self.world_data_dir / "biomes"
         biome_defs = {}
         if biomes_dir.exists():
-            for yaml_file in biomes_dir.glob("**/*.yaml"):
+            for yaml_file in _walk_yaml(biomes_dir):
                 if yaml_file.name.startswith("_"):
                     continue
                 try:
@@ -4888,7 +5303,7 @@ class ContentReloader:
         npcs_dir = self.world_data_dir / "npcs"
         fauna_templates = {}
         if npcs_dir.exists():
-            for yaml_file in npcs_dir.glob("**/*.yaml"):
+            for yaml_file in _walk_yaml(npcs_dir):
                 if yaml_file.name.startswith("_"):
                     continue
                 try:
@@ -5011,8 +5426,66 @@ class ContentReloader:
 
         return result
 
+    # In-flight reload_all pass keyed by (id(world), force). Entries are
+    # dropped when the pass finishes, so a world's id is never reused here.
+    _reload_all_inflight: dict[tuple[int, bool], asyncio.Future] = {}
+
     async def reload_all(self, force: bool = False) -> dict:
-        """Reload all content types including instances, flora, and fauna."""
+        """
+        Reload all content types including instances, flora, and fauna.
+
+        Concurrent calls for the same world and `force` flag share a single
+        reload pass instead of each re-reading the whole content tree. The
+        shared pass runs on its own session from `session_factory`, since
+        any one caller's session may be closed under it, so passes are only
+        shared when the reloader was given a factory; otherwise each call
+        runs its own pass on `session`.
+        """
+        if self.session_factory is None:
+            return await self._reload_all_impl(force)
+
+        key = (id(self.world), force)
+        inflight = ContentReloader._reload_all_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._shared_reload_all(force))
+            ContentReloader._reload_all_inflight[key] = inflight
+
+            def release(fut: asyncio.Future) -> None:
+                try:
+                    # Every awaiter may have been cancelled; retrieve the
+                    # exception so asyncio doesn't log it as unhandled
+                    if not fut.cancelled():
+                        fut.exception()
+                finally:
+                    if ContentReloader._reload_all_inflight.get(key) is fut:
+                        del ContentReloader._reload_all_inflight[key]
+
+            inflight.add_done_callback(release)
+        # Shielded so one cancelled caller doesn't cancel the shared pass
+        return await asyncio.shield(inflight)
+
+    async def _shared_reload_all(self, force: bool) -> dict:
+        """Run the shared reload_all pass on a session it owns."""
+        async with self.session_factory() as session:
+            reloader = ContentReloader(self.engine, session)
+            reloader.world_data_dir = self.world_data_dir
+            return await reloader._reload_all_impl(force)
+
+    async def _reload_all_impl(self, force: bool) -> dict:
+        """Run one full reload pass (see reload_all)."""
+        # Read and parse the area, room, item and NPC trees together in one
+        # pipeline so the reloaders below hit a warm parse cache. Applying
+        # them stays sequential: they share one AsyncSession, which does not
+        # support concurrent use, and new rooms may reference new areas.
+        await _load_yaml_files(
+            [
+                yaml_file
+                for subdir in ("areas", "rooms", "items", "npcs")
+                for yaml_file in _walk_yaml(self.world_data_dir / subdir)
+                if not yaml_file.name.startswith("_")
+            ]
+        )
+
         results = {
             "areas": await self.reload_areas(),
             "rooms": await self.reload_rooms(force=force),
@@ -5031,6 +5504,17 @@ class ContentReloader:
             "results": {k: v.model_dump() for k, v in results.items()},
         }
 
+    # Handler for each single-type reload request, called as
+    # handler(reloader, file_path, force); aliased types share a handler
+    _RELOADERS = {
+        ReloadContentType.AREAS: lambda r, fp, force: r.reload_areas(fp),
+        ReloadContentType.ROOMS: lambda r, fp, force: r.reload_rooms(fp, force=force),
+        ReloadContentType.ITEMS: lambda r, fp, force: r.reload_item_templates(fp),
+        ReloadContentType.ITEM_TEMPLATES: lambda r, fp, force: r.reload_item_templates(fp),
+        ReloadContentType.NPCS: lambda r, fp, force: r.reload_npc_templates(fp),
+        ReloadContentType.NPC_TEMPLATES: lambda r, fp, force: r.reload_npc_templates(fp),
+    }
+
 
 @router.post("/content/reload", response_model=ReloadResult)
 async def reload_content(
@@ -5047,7 +5531,8 @@ async def reload_content(
     Note: For structural changes (new rooms, areas), a full reload may be needed.
     """
     engine = get_engine_from_request(request)
-    reloader = ContentReloader(engine, session)
+    # get_session opens its sessions from AsyncSessionLocal
+    reloader = ContentReloader(engine, session, session_factory=AsyncSessionLocal)
 
     file_path = Path(reload_request.file_path) if reload_request.file_path else None
 
@@ -5080,25 +5565,14 @@ async def reload_content(
             items_failed=total_failed,
             errors=all_errors,
         )
-    elif reload_request.content_type == ReloadContentType.AREAS:
-        result = await reloader.reload_areas(file_path)
-    elif reload_request.content_type == ReloadContentType.ROOMS:
-        result = await reloader.reload_rooms(file_path, force=reload_request.force)
-    elif reload_request.content_type in (
-        ReloadContentType.ITEMS,
-        ReloadContentType.ITEM_TEMPLATES,
-    ):
-        result = await reloader.reload_item_templates(file_path)
-    elif reload_request.content_type in (
-        ReloadContentType.NPCS,
-        ReloadContentType.NPC_TEMPLATES,
-    ):
-        result = await reloader.reload_npc_templates(file_path)
-    else:
+
+    reload_handler = ContentReloader._RELOADERS.get(reload_request.content_type)
+    if reload_handler is None:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported content type: {reload_request.content_type}",
         )
+    result = await reload_handler(reloader, file_path, reload_request.force)
 
     # Audit log for individual content type reload
     admin_audit.log_content_reload(
@@ -5114,7 +5588,7 @@ async def reload_content(
     return result
 
 
-@router.post("/content/validate")
+@router.post("/content/validate", response_model=ContentValidationResponse)
 async def validate_content(
     request: Request,
     validate_request: ValidateRequest,
@@ -5133,49 +5607,46 @@ async def validate_content(
     world_data_dir = reloader.world_data_dir
 
     # Determine which directory to validate
-    if validate_request.content_type == ReloadContentType.AREAS:
-        content_dir = world_data_dir / "areas"
-    elif validate_request.content_type == ReloadContentType.ROOMS:
-        content_dir = world_data_dir / "rooms"
-    elif validate_request.content_type in (
-        ReloadContentType.ITEMS,
-        ReloadContentType.ITEM_TEMPLATES,
-    ):
-        content_dir = world_data_dir / "items"
-    elif validate_request.content_type in (
-        ReloadContentType.NPCS,
-        ReloadContentType.NPC_TEMPLATES,
-    ):
-        content_dir = world_data_dir / "npcs"
-    elif validate_request.content_type == ReloadContentType.NPC_SPAWNS:
-        content_dir = world_data_dir / "npc_spawns"
-    else:
+    content_subdir = ContentReloader._CONTENT_DIRS.get(validate_request.content_type)
+    if content_subdir is None:
         raise HTTPException(
             status_code=400, detail="Unsupported content type for validation"
         )
+    content_dir = world_data_dir / content_subdir
 
     if validate_request.file_path:
         yaml_files = [Path(validate_request.file_path)]
     else:
-        yaml_files = list(content_dir.glob("**/*.yaml")) if content_dir.exists() else []
-
-    results = []
-    for yaml_file in yaml_files:
-        result = await reloader.validate_yaml_file(
-            yaml_file, validate_request.content_type
-        )
-        results.append(result.model_dump())
-
-    all_valid = all(r["is_valid"] for r in results)
+        yaml_files = _walk_yaml(content_dir)
+
+    # Files are independent, so validate them concurrently in worker threads.
+    # The semaphore bounds in-flight work to avoid oversubscribing the pool.
+    semaphore = asyncio.Semaphore(min(32, (os.cpu_count() or 1) * 2))
+
+    async def validate_one(yaml_file: Path) -> ValidationResult:
+        async with semaphore:
+            return await asyncio.to_thread(
+                reloader._validate_yaml_file_sync,
+                yaml_file,
+                validate_request.content_type,
+            )
 
-    return {
-        "success": all_valid,
-        "content_type": validate_request.content_type.value,
-        "files_checked": len(results),
-        "files_valid": sum(1 for r in results if r["is_valid"]),
-        "files_invalid": sum(1 for r in results if not r["is_valid"]),
-        "results": results,
-    }
+    # Keep the ValidationResult models as-is; with a declared response model
+    # FastAPI serializes them straight to JSON bytes via Pydantic, so there
+    # is no per-file model_dump() and no jsonable_encoder pass
+    results: list[ValidationResult] = await asyncio.gather(
+        *(validate_one(yaml_file) for yaml_file in yaml_files)
+    )
+    files_valid = sum(1 for r in results if r.is_valid)
+
+    return ContentValidationResponse(
+        success=files_valid == len(results),
+        content_type=validate_request.content_type.value,
+        files_checked=len(results),
+        files_valid=files_valid,
+        files_invalid=len(results) - files_valid,
+        results=results,
+    )
 
 
 @router.get("/classes")
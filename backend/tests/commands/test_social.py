@@ -10,10 +10,12 @@ Comprehensive test suite covering:
 
 import pytest
 
+from daemons.commands.social.fchan import FactionChatCommand
 from daemons.commands.social.follow import FollowCommand
 from daemons.commands.social.tell import TellCommand
 from daemons.commands.social.yell import YellCommand
 from daemons.engine.systems.context import GameContext
+from daemons.engine.systems.events import EventDispatcher
 from daemons.engine.world import EntityType, World, WorldPlayer, WorldRoom
 
 # ============ FIXTURES ============
@@ -431,6 +433,83 @@ class TestYellCommand:
         assert len(room_events) >= 1
 
 
+# ============ FACTION CHAT COMMAND TESTS ============
+
+
+class TestFactionChatCommand:
+    """Test faction chat broadcast command."""
+
+    @pytest.fixture
+    def faction_ctx(self, ctx_with_events):
+        """Put players 0-2 in one faction and connect all but player_2."""
+        ctx_with_events.faction_system = None
+        players = ctx_with_events.world.players
+        for i in range(3):
+            players[f"player_{i}"].faction_id = "guild"
+        players["player_3"].faction_id = "rivals"
+        for pid in ("player_0", "player_1", "player_3"):
+            ctx_with_events.register_listener(pid)
+        return ctx_with_events
+
+    def test_online_player_ids_tracks_listeners(self, faction_ctx):
+        """Test the online ids follow listener registration."""
+        assert set(faction_ctx.online_player_ids()) == {
+            "player_0",
+            "player_1",
+            "player_3",
+        }
+
+        faction_ctx.unregister_listener("player_1")
+        assert "player_1" not in faction_ctx.online_player_ids()
+
+    def test_fchan_reaches_online_faction_members(self, faction_ctx):
+        """Test only connected members of the sender's faction are messaged."""
+        handler = FactionChatCommand(faction_ctx)
+        events = handler.handle_fchan("player_0", "Player0", "Rally!")
+
+        assert events[0]["player_id"] == "player_0"
+        assert events[0]["text"] == "[guild] You: Rally!"
+        assert events[1]["player_ids"] == ["player_1"]
+        assert events[1]["text"] == "[guild] Player0: Rally!"
+
+    async def test_fchan_event_fans_out_to_each_member(self, faction_ctx):
+        """Test the dispatcher delivers the multi-recipient event per player."""
+        faction_ctx.register_listener("player_2")
+        handler = FactionChatCommand(faction_ctx)
+        events = handler.handle_fchan("player_0", "Player0", "Rally!")
+
+        await EventDispatcher(faction_ctx).dispatch(events)
+
+        for pid in ("player_1", "player_2"):
+            received = faction_ctx.get_listener(pid).get_nowait()
+            assert received["player_id"] == pid
+            assert received["text"] == "[guild] Player0: Rally!"
+            assert "player_ids" not in received
+        assert faction_ctx.get_listener("player_3").empty()
+
+    async def test_context_dispatch_strips_routing_keys(self, faction_ctx):
+        """Test GameContext delivers the same per-player events as the dispatcher."""
+        handler = FactionChatCommand(faction_ctx)
+        events = handler.handle_fchan("player_0", "Player0", "Rally!")
+
+        await faction_ctx.dispatch_events(events[1:])
+
+        received = faction_ctx.get_listener("player_1").get_nowait()
+        assert received == {
+            "type": "message",
+            "player_id": "player_1",
+            "text": "[guild] Player0: Rally!",
+            "payload": events[1]["payload"],
+        }
+
+    def test_fchan_without_faction(self, faction_ctx):
+        """Test players outside any faction are told to join one."""
+        handler = FactionChatCommand(faction_ctx)
+        events = handler.handle_fchan("player_4", "Player4", "Hello?")
+
+        assert "not a member of any faction" in events[0]["text"]
+
+
 # ============ EDGE CASES ============
 
 
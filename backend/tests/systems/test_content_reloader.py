@@ -0,0 +1,579 @@
+"""
+Tests for the admin ContentReloader (YAML hot-reload and validation).
+"""
+
+import asyncio
+import contextlib
+import gc
+import os
+from types import SimpleNamespace
+
+import pytest
+import yaml
+from fastapi.encoders import jsonable_encoder
+
+from daemons.engine.world import World, WorldRoom
+from daemons.routes import admin
+from daemons.routes.admin import (
+    ContentReloader,
+    ReloadContentType,
+    ValidateRequest,
+    ValidationResult,
+    _load_yaml_cached,
+    _walk_yaml,
+    validate_content,
+)
+
+
+@pytest.fixture
+def reloader(temp_world_data):
+    """ContentReloader bound to an empty world and the temp world_data dir."""
+    engine = SimpleNamespace(world=World(rooms={}, players={}))
+    content_reloader = ContentReloader(engine, session=None)
+    content_reloader.world_data_dir = temp_world_data
+    return content_reloader
+
+
+@pytest.mark.systems
+class TestContentValidation:
+    """Test YAML validation without loading content."""
+
+    async def test_validate_valid_item(self, reloader, temp_world_data):
+        item_file = temp_world_data / "items" / "sword.yaml"
+        item_file.write_text("id: sword\nname: Sword\nitem_type: weapon\n")
+
+        result = await reloader.validate_yaml_file(
+            item_file, ReloadContentType.ITEM_TEMPLATES
+        )
+
+        assert result.is_valid
+        assert result.errors == []
+
+    async def test_validate_missing_fields(self, reloader, temp_world_data):
+        room_file = temp_world_data / "rooms" / "bad_room.yaml"
+        room_file.write_text("id: bad_room\n")
+
+        result = await reloader.validate_yaml_file(room_file, ReloadContentType.ROOMS)
+
+        assert not result.is_valid
+        assert result.errors == [
+            "Missing required field: name",
+            "Missing required field: description",
+        ]
+
+    async def test_validate_missing_file(self, reloader, temp_world_data):
+        result = await reloader.validate_yaml_file(
+            temp_world_data / "areas" / "nowhere.yaml", ReloadContentType.AREAS
+        )
+
+        assert not result.is_valid
+        assert result.errors[0].startswith("File not found")
+
+    async def test_validate_parse_error(self, reloader, temp_world_data):
+        area_file = temp_world_data / "areas" / "broken.yaml"
+        area_file.write_text("id: [unclosed\n")
+
+        result = await reloader.validate_yaml_file(area_file, ReloadContentType.AREAS)
+
+        assert not result.is_valid
+        assert result.errors[0].startswith("YAML parse error")
+
+    async def test_validate_non_mapping_document(self, reloader, temp_world_data):
+        area_file = temp_world_data / "areas" / "listed.yaml"
+        area_file.write_text("- just\n- a list\n")
+
+        result = await reloader.validate_yaml_file(area_file, ReloadContentType.AREAS)
+
+        assert not result.is_valid
+        assert result.errors == [
+            "Missing required field: id",
+            "Missing required field: name",
+        ]
+
+    async def test_validate_npc_spawns(self, reloader, temp_world_data):
+        spawns_dir = temp_world_data / "npc_spawns"
+        spawns_dir.mkdir()
+        spawn_file = spawns_dir / "spawns.yaml"
+        spawn_file.write_text(
+            "spawns:\n"
+            "  - template_id: goblin\n"
+            "    room_id: cave\n"
+            "  - template_id: wolf\n"
+        )
+
+        result = await reloader.validate_yaml_file(
+            spawn_file, ReloadContentType.NPC_SPAWNS
+        )
+
+        assert not result.is_valid
+        assert result.errors == ["Spawn 1: missing room_id"]
+
+
+def _write_aged(path, text, mtime_ns=1_000_000_000_000_000_000):
+    """Write a file with an mtime old enough for the parse cache to trust."""
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def yaml_parses(monkeypatch):
+    """Count the files actually parsed by the YAML loader."""
+    parses = []
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):
+        parses.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(admin, "_yaml_cache", {})
+    monkeypatch.setattr(yaml, "load", counting_load)
+    return parses
+
+
+@pytest.mark.systems
+class TestYamlCache:
+    """Test the parsed-YAML cache shared by reloads."""
+
+    def test_unchanged_file_reuses_parse(self, temp_world_data, yaml_parses):
+        item_file = temp_world_data / "items" / "gem.yaml"
+        _write_aged(item_file, "id: gem\nname: Gem\n")
+
+        first = _load_yaml_cached(item_file)
+        second = _load_yaml_cached(item_file)
+
+        assert second == first
+        assert len(yaml_parses) == 1
+
+    def test_callers_get_their_own_copy(self, temp_world_data, yaml_parses):
+        item_file = temp_world_data / "items" / "gem.yaml"
+        _write_aged(item_file, "id: gem\nname: Gem\nkeywords: [gem]\n")
+
+        _load_yaml_cached(item_file)["keywords"].append("mutated")
+        _load_yaml_cached(item_file)["keywords"].append("again")
+
+        assert _load_yaml_cached(item_file)["keywords"] == ["gem"]
+        assert len(yaml_parses) == 1
+
+    def test_edited_file_is_reparsed(self, temp_world_data):
+        item_file = temp_world_data / "items" / "gem.yaml"
+        _write_aged(item_file, "id: gem\nname: Gem\n")
+        assert _load_yaml_cached(item_file)["name"] == "Gem"
+
+        _write_aged(item_file, "id: gem\nname: Ruby Gem\n", 1_000_000_000_001_000_000)
+
+        assert _load_yaml_cached(item_file)["name"] == "Ruby Gem"
+
+    def test_recently_modified_file_is_not_cached(self, temp_world_data, yaml_parses):
+        item_file = temp_world_data / "items" / "gem.yaml"
+        item_file.write_text("id: gem\nname: Gem\n")
+        assert _load_yaml_cached(item_file)["name"] == "Gem"
+
+        # Same size, and the mtime may not even have moved
+        item_file.write_text("id: gem\nname: Ruy\n")
+        stat = item_file.stat()
+
+        assert _load_yaml_cached(item_file)["name"] == "Ruy"
+        assert str(item_file) not in admin._yaml_cache
+        assert len(yaml_parses) == 2
+        assert stat.st_size == len("id: gem\nname: Gem\n")
+
+    def test_eviction_drops_least_recently_used(
+        self, temp_world_data, monkeypatch, yaml_parses
+    ):
+        monkeypatch.setattr(admin, "_YAML_CACHE_MAX_ENTRIES", 2)
+        files = []
+        for name in ("a", "b", "c"):
+            item_file = temp_world_data / "items" / f"{name}.yaml"
+            _write_aged(item_file, f"id: {name}\nname: {name}\n")
+            files.append(item_file)
+        a, b, c = files
+
+        _load_yaml_cached(a)
+        _load_yaml_cached(b)
+        # Touching a makes b the least recently used entry
+        _load_yaml_cached(a)
+        _load_yaml_cached(c)
+
+        assert set(admin._yaml_cache) == {str(a), str(c)}
+        _load_yaml_cached(a)
+        assert len(yaml_parses) == 3
+
+    def test_large_file_parses_via_mmap(self, temp_world_data):
+        room_file = temp_world_data / "rooms" / "long_room.yaml"
+        description = "x" * (128 * 1024)
+        room_file.write_text(f"id: long_room\nname: Long\ndescription: {description}\n")
+
+        data = _load_yaml_cached(room_file)
+
+        assert data["id"] == "long_room"
+        assert len(data["description"]) == len(description)
+
+
+@pytest.mark.systems
+class TestYamlListing:
+    """Test the memoized recursive YAML listing."""
+
+    @staticmethod
+    def _age_tree(root):
+        """Push directory mtimes into the past so the listing is cacheable."""
+        old = 1_000_000_000_000_000_000
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, ns=(old, old))
+
+    def test_lists_nested_yaml_only(self, temp_world_data):
+        nested = temp_world_data / "items" / "weapons"
+        nested.mkdir()
+        (nested / "axe.yaml").write_text("id: axe\nname: Axe\n")
+        (nested / "notes.txt").write_text("not yaml")
+
+        names = {p.name for p in _walk_yaml(temp_world_data / "items")}
+
+        assert "axe.yaml" in names
+        assert "_schema.yaml" in names
+        assert "notes.txt" not in names
+
+    def test_symlink_loop_is_not_followed(self, temp_world_data):
+        nested = temp_world_data / "items" / "weapons"
+        nested.mkdir()
+        (nested / "axe.yaml").write_text("id: axe\nname: Axe\n")
+        (nested / "loop").symlink_to(temp_world_data / "items")
+
+        files = _walk_yaml(temp_world_data / "items")
+
+        assert [p.name for p in files].count("axe.yaml") == 1
+        assert len(files) == len(set(files))
+
+    def test_missing_root_is_empty(self, temp_world_data):
+        assert _walk_yaml(temp_world_data / "does_not_exist") == []
+
+    def test_new_file_invalidates_listing(self, temp_world_data):
+        nested = temp_world_data / "npcs" / "goblins"
+        nested.mkdir()
+        self._age_tree(temp_world_data / "npcs")
+        before = _walk_yaml(temp_world_data / "npcs")
+
+        (nested / "goblin.yaml").write_text("id: goblin\nname: Goblin\n")
+        after = _walk_yaml(temp_world_data / "npcs")
+
+        assert len(after) == len(before) + 1
+
+
+@pytest.mark.systems
+class TestReloadItemTemplates:
+    """Test hot-reloading item templates into the world."""
+
+    async def test_reload_loads_and_reports_failures(self, reloader, temp_world_data):
+        items_dir = temp_world_data / "items"
+        (items_dir / "sword.yaml").write_text("id: sword\nname: Sword\nweight: 3.5\n")
+        (items_dir / "broken.yaml").write_text("id: [unclosed\n")
+        (items_dir / "nameless.yaml").write_text("description: no id here\n")
+
+        result = await reloader.reload_item_templates()
+
+        assert result.items_loaded == 1
+        assert result.items_failed == 2
+        assert not result.success
+        template = reloader.world.item_templates["sword"]
+        assert template.name == "Sword"
+        assert template.weight == 3.5
+
+    async def test_reload_counts_updates(self, reloader, temp_world_data):
+        (temp_world_data / "items" / "sword.yaml").write_text(
+            "id: sword\nname: Sword\n"
+        )
+
+        await reloader.reload_item_templates()
+        result = await reloader.reload_item_templates()
+
+        assert result.success
+        assert result.items_updated == 1
+        assert result.items_loaded == 0
+
+    async def test_reload_swaps_in_new_dict(self, reloader, temp_world_data):
+        (temp_world_data / "items" / "sword.yaml").write_text(
+            "id: sword\nname: Sword\n"
+        )
+        before = reloader.world.item_templates
+        before["legacy"] = "kept"
+
+        await reloader.reload_item_templates()
+
+        assert reloader.world.item_templates is not before
+        assert "sword" not in before
+        assert reloader.world.item_templates["legacy"] == "kept"
+
+
+@pytest.mark.systems
+class TestReloadNpcTemplates:
+    """Test hot-reloading NPC templates into the world."""
+
+    async def test_reload_maps_yaml_fields(self, reloader, temp_world_data):
+        (temp_world_data / "npcs" / "goblin.yaml").write_text(
+            "id: goblin\n"
+            "name: Goblin\n"
+            "level: 2\n"
+            "faction_id: greenskins\n"
+            "behavior:\n"
+            "  - aggressive\n"
+            "loot_table:\n"
+            "  - template_id: gold\n"
+            "    chance: 0.5\n"
+            "spawn_notes: ignored by the runtime template\n"
+        )
+
+        result = await reloader.reload_npc_templates()
+
+        assert result.success, result.errors
+        template = reloader.world.npc_templates["goblin"]
+        assert template.level == 2
+        assert template.max_health == 10
+        assert template.faction_id == "greenskins"
+        assert template.behaviors == ["aggressive"]
+        assert template.resolved_behavior
+        assert template.drop_table == [{"template_id": "gold", "chance": 0.5}]
+
+
+@pytest.mark.systems
+class TestReloadRooms:
+    """Test hot-reloading rooms that are already in the world."""
+
+    async def test_reload_replaces_exits(self, reloader, temp_world_data):
+        room = WorldRoom(
+            id="hall",
+            name="Hall",
+            description="Old",
+            exits={"north": "old_north", "west": "old_west"},
+        )
+        reloader.world.rooms["hall"] = room
+        (temp_world_data / "rooms" / "hall.yaml").write_text(
+            "id: hall\n"
+            "name: Hall\n"
+            "description: New\n"
+            "exits:\n"
+            "  north: new_north\n"
+            "  east: new_east\n"
+            "  sideways: nowhere\n"
+        )
+
+        result = await reloader.reload_rooms()
+
+        assert result.items_updated == 1
+        assert room.description == "New"
+        assert room.exits == {"north": "new_north", "east": "new_east"}
+
+
+@pytest.mark.systems
+class TestNpcSpawnStreamValidation:
+    """The streaming spawn validator must agree with the dict-based one."""
+
+    @staticmethod
+    def _validate(reloader, spawn_file, stream_min_bytes, monkeypatch):
+        monkeypatch.setattr(admin, "_STREAM_VALIDATE_MIN_BYTES", stream_min_bytes)
+        admin._yaml_cache.pop(str(spawn_file), None)
+        return reloader._validate_yaml_file_sync(
+            spawn_file, ReloadContentType.NPC_SPAWNS
+        )
+
+    @pytest.mark.parametrize(
+        "content, streams",
+        [
+            ("spawns:\n  - template_id: a\n    room_id: r\n", True),
+            ("spawns:\n  - template_id: a\n  - room_id: r\n  - {}\n", True),
+            (
+                "spawns:\n  - template_id: a\n    room_id: r\n"
+                "    extra: {room_id: x}\n"
+                "  - template_id: b\n    nested: [room_id]\n",
+                True,
+            ),
+            ("name: no spawns here\n", True),
+            ("spawns: []\n", True),
+            ("", True),
+            ("spawns: []\n---\nspawns: []\n", True),
+            ("spawns:\n  - {room_id: r}\n  - {template_id: [\n", True),
+            ("base: &b {template_id: t}\nspawns:\n  - {<<: *b, room_id: r}\n", False),
+            ("base: &b {template_id: t}\nspawns:\n  - {<<: *b}\n", False),
+            ("s: &s {template_id: t, room_id: r}\nspawns:\n  - *s\n  - {}\n", False),
+            ("just a scalar\n", False),
+            ("spawns\n", False),
+            ("- spawns\n", False),
+            ("~\n", False),
+            ("spawns: {template_id: a}\n", False),
+            ("spawns:\n", False),
+            ("spawns:\n  - {template_id: a}\n  - ~\n  - room_id\n", False),
+            ("spawns: !!seq []\n", False),
+            ("spawns: []\nspawns: [{}]\n", False),
+        ],
+    )
+    def test_matches_full_load(self, reloader, tmp_path, monkeypatch, content, streams):
+        spawn_file = tmp_path / "spawns.yaml"
+        spawn_file.write_text(content)
+
+        loaded = self._validate(reloader, spawn_file, 1 << 62, monkeypatch)
+        if streams:
+            # The stream must handle this shape without deferring to a load
+            monkeypatch.setattr(admin, "_load_yaml_cached", None)
+        streamed = self._validate(reloader, spawn_file, 0, monkeypatch)
+
+        assert (streamed.is_valid, streamed.errors, streamed.warnings) == (
+            loaded.is_valid,
+            loaded.errors,
+            loaded.warnings,
+        )
+
+    def test_empty_file(self, reloader, tmp_path):
+        spawn_file = tmp_path / "spawns.yaml"
+        spawn_file.write_text("")
+
+        result = reloader._validate_npc_spawn_stream(
+            spawn_file, ValidationResult(file_path="x", is_valid=True)
+        )
+
+        assert result.errors == ["Empty or invalid YAML file"]
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory that hands out a fresh sentinel session per call."""
+    opened = []
+
+    @contextlib.asynccontextmanager
+    async def factory():
+        session = object()
+        opened.append(session)
+        yield session
+
+    factory.opened = opened
+    return factory
+
+
+@pytest.fixture
+def fake_reload_impl(monkeypatch):
+    """Replace the reload pass with one that records the session it used."""
+    sessions = []
+
+    async def fake_impl(self, force):
+        sessions.append(self.session)
+        await asyncio.sleep(0)
+        return {"success": True, "results": {}}
+
+    monkeypatch.setattr(ContentReloader, "_reload_all_impl", fake_impl)
+    return sessions
+
+
+def _reloader_for(world, temp_world_data, session_factory, session=None):
+    engine = SimpleNamespace(world=world)
+    content_reloader = ContentReloader(
+        engine, session=session, session_factory=session_factory
+    )
+    content_reloader.world_data_dir = temp_world_data
+    return content_reloader
+
+
+@pytest.mark.systems
+class TestReloadAll:
+    """Test full reloads."""
+
+    async def test_concurrent_reloads_share_one_pass(
+        self, temp_world_data, session_factory, fake_reload_impl
+    ):
+        world = World(rooms={}, players={})
+        callers = [
+            _reloader_for(world, temp_world_data, session_factory, object())
+            for _ in "ab"
+        ]
+
+        first, second = await asyncio.gather(*(r.reload_all() for r in callers))
+
+        assert first is second
+        # The shared pass ran once, on its own session rather than a caller's
+        assert fake_reload_impl == session_factory.opened
+        assert len(fake_reload_impl) == 1
+
+    async def test_sequential_reloads_run_again(
+        self, temp_world_data, session_factory, fake_reload_impl
+    ):
+        world = World(rooms={}, players={})
+        reloader = _reloader_for(world, temp_world_data, session_factory)
+
+        await reloader.reload_all()
+        await reloader.reload_all()
+
+        assert len(fake_reload_impl) == 2
+
+    async def test_worlds_do_not_share_passes(
+        self, temp_world_data, session_factory, fake_reload_impl
+    ):
+        reloaders = [
+            _reloader_for(World(rooms={}, players={}), temp_world_data, session_factory)
+            for _ in "ab"
+        ]
+
+        await asyncio.gather(*(r.reload_all() for r in reloaders))
+
+        assert len(fake_reload_impl) == 2
+
+    async def test_without_factory_uses_callers_session(
+        self, reloader, fake_reload_impl
+    ):
+        reloader.session = session = object()
+
+        await reloader.reload_all()
+
+        assert fake_reload_impl == [session]
+
+    async def test_failure_after_callers_cancelled_is_retrieved(
+        self, temp_world_data, session_factory, monkeypatch
+    ):
+        release = asyncio.Event()
+
+        async def failing_impl(self, force):
+            await release.wait()
+            raise RuntimeError("reload failed")
+
+        monkeypatch.setattr(ContentReloader, "_reload_all_impl", failing_impl)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        monkeypatch.setattr(
+            loop, "call_exception_handler", lambda context: unhandled.append(context)
+        )
+        reloader = _reloader_for(
+            World(rooms={}, players={}), temp_world_data, session_factory
+        )
+
+        caller = asyncio.ensure_future(reloader.reload_all())
+        await asyncio.sleep(0)
+        (inflight,) = ContentReloader._reload_all_inflight.values()
+        caller.cancel()
+        release.set()
+        # asyncio.wait doesn't retrieve the exception itself
+        await asyncio.wait([inflight])
+        del inflight
+        gc.collect()
+
+        assert ContentReloader._reload_all_inflight == {}
+        assert unhandled == []
+
+
+@pytest.mark.systems
+class TestValidateContentEndpoint:
+    """Test the /content/validate handler response."""
+
+    async def test_response_is_json_encodable(self, temp_world_data):
+        item_file = temp_world_data / "items" / "nameless.yaml"
+        item_file.write_text("id: nameless\n")
+        engine = SimpleNamespace(world=World(rooms={}, players={}))
+        request = SimpleNamespace(
+            app=SimpleNamespace(state=SimpleNamespace(world_engine=engine))
+        )
+
+        response = await validate_content(
+            request,
+            ValidateRequest(content_type="items", file_path=str(item_file)),
+            session=None,
+            admin={},
+        )
+        encoded = jsonable_encoder(response)
+
+        assert encoded["files_checked"] == 1
+        assert encoded["files_invalid"] == 1
+        assert encoded["results"][0]["errors"] == ["Missing required field: name"]
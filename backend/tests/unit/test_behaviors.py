@@ -0,0 +1,137 @@
+"""
+Unit tests for faction-aware behavior scripts.
+
+Tests BehaviorContext.get_room_faction_allies and the social/support
+behaviors that use it.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from daemons.engine.behaviors.base import BehaviorContext
+from daemons.engine.behaviors.social import Social
+from daemons.engine.behaviors.support import Buffer, Healer
+from daemons.engine.world import EntityType, World, WorldNpc, WorldPlayer, WorldRoom
+
+
+def _add_npc(world, npc_id, template_id, health=50):
+    npc = WorldNpc(
+        id=npc_id,
+        entity_type=EntityType.NPC,
+        name=npc_id.title(),
+        room_id="camp",
+        current_health=health,
+        max_health=50,
+        template_id=template_id,
+    )
+    world.npcs[npc_id] = npc
+    world.rooms["camp"].entities.add(npc_id)
+    return npc
+
+
+def _add_player(world, player_id, faction_id, health=100):
+    player = WorldPlayer(
+        id=player_id,
+        entity_type=EntityType.PLAYER,
+        name=player_id.title(),
+        room_id="camp",
+        current_health=health,
+        max_health=100,
+        faction_id=faction_id,
+    )
+    world.players[player_id] = player
+    world.rooms["camp"].entities.add(player_id)
+    return player
+
+
+@pytest.fixture
+def camp():
+    """A room holding a guard, its faction allies, and outsiders."""
+    world = World(
+        rooms={"camp": WorldRoom(id="camp", name="Camp", description="Tents")},
+        players={},
+    )
+    world.npc_templates["guard"] = SimpleNamespace(faction_id="watch")
+    world.npc_templates["bandit"] = SimpleNamespace(faction_id="outlaws")
+    guard = _add_npc(world, "guard", "guard")
+    _add_npc(world, "sergeant", "guard", health=20)
+    _add_npc(world, "bandit", "bandit")
+    _add_npc(world, "ghost", "missing_template")
+    _add_player(world, "watchman", "watch", health=60)
+    _add_player(world, "stranger", None)
+    return world, guard
+
+
+def _ctx(world, npc, config=None):
+    return BehaviorContext(
+        npc=npc,
+        world=world,
+        template=world.npc_templates[npc.template_id],
+        config=config or {},
+    )
+
+
+@pytest.mark.unit
+def test_room_faction_allies_lists_npcs_then_players(camp):
+    """Test only same-faction entities other than self are returned."""
+    world, guard = camp
+
+    allies = _ctx(world, guard).get_room_faction_allies("watch")
+
+    assert [a.id for a in allies] == ["sergeant", "watchman"]
+
+
+@pytest.mark.unit
+def test_room_faction_allies_without_faction_matches_everyone(camp):
+    """Test a None faction matches every templated NPC and player."""
+    world, guard = camp
+
+    allies = _ctx(world, guard).get_room_faction_allies(None)
+
+    assert {a.id for a in allies} == {"sergeant", "bandit", "watchman", "stranger"}
+
+
+@pytest.mark.unit
+async def test_social_calls_for_help_only_with_allies(camp):
+    """Test Social cries for help only when an ally is present."""
+    world, guard = camp
+    ctx = _ctx(world, guard)
+
+    assert (await Social().on_damaged(ctx, "bandit", 5)).call_for_help
+
+    world.rooms["camp"].entities -= {"sergeant", "watchman"}
+    assert not (await Social().on_damaged(ctx, "bandit", 5)).call_for_help
+
+
+@pytest.mark.unit
+def test_healer_targets_lowest_injured_ally(camp):
+    """Test Healer picks the lowest-HP same-faction ally under the threshold."""
+    world, guard = camp
+    ctx = _ctx(world, guard)
+
+    assert Healer()._find_heal_target(ctx, 70, True).id == "sergeant"
+    assert Healer()._find_heal_target(ctx, 30, True) is None
+    assert Healer()._find_heal_target(ctx, 70, False).id in {"sergeant", "watchman"}
+
+
+@pytest.mark.unit
+def test_buffer_targets_ally_in_combat(camp):
+    """Test Buffer prefers the lowest-HP ally that is fighting."""
+    world, guard = camp
+    ctx = _ctx(world, guard)
+
+    assert Buffer()._find_buff_target(ctx, True) is None
+
+    world.npcs["sergeant"].target_id = "bandit"
+    assert Buffer()._find_buff_target(ctx, True).id == "sergeant"
+    assert Buffer()._find_buff_target(ctx, False).id in {"sergeant", "watchman"}
+
+
+@pytest.mark.unit
+def test_lone_npc_has_no_allies(camp):
+    """Test an NPC alone in its room finds no allies, even without a faction."""
+    world, guard = camp
+    world.rooms["camp"].entities.intersection_update({"guard"})
+
+    assert _ctx(world, guard).get_room_faction_allies(None) == []
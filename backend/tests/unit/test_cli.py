@@ -0,0 +1,427 @@
+"""
+Unit tests for the daemons CLI helpers and commands.
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import zipfile
+
+import pytest
+from click.testing import CliRunner
+
+from daemons import cli
+from daemons.cli import _copy_tree, _load_alembic_config, main
+
+
+class _FakeResponse(io.BytesIO):
+    """Minimal stand-in for the object urllib.request.urlopen returns."""
+
+    def __init__(self, payload: bytes):
+        super().__init__(payload)
+        self.headers = {"Content-Length": str(len(payload))}
+
+
+@pytest.fixture
+def fake_download(monkeypatch):
+    """Serve a fixed payload for every urlopen call on a Linux-like platform."""
+    payload = b"\x7fELF" + b"x" * (3 << 20)
+    requests = []
+
+    def fake_urlopen(req, *args, **kwargs):
+        requests.append(req)
+        return _FakeResponse(payload)
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        cli,
+        "_get_platform_info",
+        lambda: ("linux", ".AppImage", "Daemonswright.AppImage"),
+    )
+    return payload, requests
+
+
+@pytest.mark.unit
+def test_copy_tree_copies_nested_files(tmp_path):
+    """Test _copy_tree reproduces the source tree."""
+    src = tmp_path / "src"
+    (src / "items" / "weapons").mkdir(parents=True)
+    (src / "empty").mkdir()
+    (src / "areas.yaml").write_text("id: area\n")
+    (src / "items" / "weapons" / "sword.yaml").write_text("id: sword\n")
+
+    copied = _copy_tree(src, tmp_path / "dst")
+
+    assert sorted(copied) == [
+        "areas.yaml",
+        os.path.join("items", "weapons", "sword.yaml"),
+    ]
+    assert (tmp_path / "dst" / "empty").is_dir()
+    assert (tmp_path / "dst" / "items" / "weapons" / "sword.yaml").read_text() == (
+        "id: sword\n"
+    )
+
+
+@pytest.mark.unit
+def test_copy_tree_follows_symlinks(tmp_path):
+    """Test _copy_tree copies through symlinks and skips a link cycle."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "axe.yaml").write_text("id: axe\n")
+    src = tmp_path / "src"
+    (src / "items").mkdir(parents=True)
+    (src / "items" / "sword.yaml").symlink_to(shared / "axe.yaml")
+    (src / "items" / "weapons").symlink_to(shared)
+    (src / "items" / "loop").symlink_to(src)
+
+    copied = _copy_tree(src, tmp_path / "dst")
+
+    assert sorted(copied) == [
+        os.path.join("items", "sword.yaml"),
+        os.path.join("items", "weapons", "axe.yaml"),
+    ]
+    dst_items = tmp_path / "dst" / "items"
+    assert not (dst_items / "sword.yaml").is_symlink()
+    assert (dst_items / "sword.yaml").read_text() == "id: axe\n"
+    assert not (dst_items / "weapons").is_symlink()
+    assert (dst_items / "weapons" / "axe.yaml").read_text() == "id: axe\n"
+    assert not (dst_items / "loop").exists()
+
+
+@pytest.mark.unit
+def test_init_scaffolds_project(tmp_path, monkeypatch):
+    """Test `daemons init` creates the starter project."""
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(main, ["init", "game"])
+
+    assert result.exit_code == 0, result.output
+    project = tmp_path / "game"
+    assert (project / "main.py").exists()
+    assert (project / "config.py").exists()
+    assert (project / ".gitignore").exists()
+    assert any((project / "world_data" / "rooms").iterdir())
+    yaml_count = len(list((project / "world_data").rglob("*.yaml")))
+    assert f"({yaml_count} YAML files)" in result.output
+
+
+@pytest.mark.unit
+def test_alembic_config_defaults_to_bundled_migrations(tmp_path, monkeypatch):
+    """Test the db commands fall back to the engine's migrations."""
+    monkeypatch.chdir(tmp_path)
+
+    alembic_cfg = _load_alembic_config()
+
+    assert alembic_cfg.config_file_name is None
+    assert alembic_cfg.get_main_option("script_location").endswith("alembic")
+    assert "dungeon.db" in alembic_cfg.get_main_option("sqlalchemy.url")
+
+
+@pytest.mark.unit
+def test_alembic_config_prefers_local_ini(tmp_path, monkeypatch):
+    """Test a project's own alembic.ini takes precedence."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "alembic.ini").write_text("[alembic]\nscript_location = migrations\n")
+
+    alembic_cfg = _load_alembic_config()
+
+    assert alembic_cfg.config_file_name == "alembic.ini"
+    assert alembic_cfg.get_main_option("script_location") == "migrations"
+
+
+@pytest.mark.unit
+def test_download_wright_streams_appimage(tmp_path, fake_download):
+    """Test the download writes the whole payload and installs the AppImage."""
+    payload, _ = fake_download
+
+    exe_path = cli._download_wright("v1.0.0", tmp_path)
+
+    assert exe_path == tmp_path / "v1.0.0" / "Daemonswright.AppImage"
+    assert exe_path.read_bytes() == payload
+    assert os.access(exe_path, os.X_OK)
+
+
+@pytest.mark.unit
+def test_download_progress_is_throttled(tmp_path, fake_download, capsys):
+    """Test the progress bar is not redrawn for every chunk."""
+    cli._download_wright("v1.0.0", tmp_path)
+
+    output = capsys.readouterr().out
+    assert output.count("\r   [") < 4
+    assert "100.0%" in output
+
+
+@pytest.mark.unit
+def test_cached_wright_found_from_marker(tmp_path, fake_download, monkeypatch):
+    """Test a downloaded executable is found again via its marker file."""
+    monkeypatch.setattr(cli, "_get_wright_cache_dir", lambda: tmp_path)
+    exe_path = cli._download_wright("v1.0.0", tmp_path)
+
+    assert (tmp_path / "v1.0.0" / "exe_path.txt").exists()
+    assert cli._find_cached_wright() == exe_path
+
+
+@pytest.mark.unit
+def test_extract_zip_matches_extractall(tmp_path):
+    """Test the threaded extractor produces the same tree as extractall."""
+    archive_path = tmp_path / "app.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("resources/", "")
+        zf.writestr("Daemonswright.exe", b"MZ" * 1000)
+        zf.writestr("resources/app/index.js", "console.log(1)")
+        zf.writestr("locales/en-US.pak", b"pak")
+        zf.writestr("../escape.txt", "kept inside")
+
+    cli._extract_zip(archive_path, tmp_path / "threaded")
+    with zipfile.ZipFile(archive_path) as zf:
+        zf.extractall(tmp_path / "serial")
+
+    def tree(root):
+        return {
+            p.relative_to(root).as_posix(): p.read_bytes() if p.is_file() else None
+            for p in root.rglob("*")
+        }
+
+    assert tree(tmp_path / "threaded") == tree(tmp_path / "serial")
+    assert not (tmp_path / "escape.txt").exists()
+
+
+@pytest.fixture
+def releases_api(tmp_path, monkeypatch):
+    """Fake the GitHub releases API, honouring If-None-Match."""
+    calls = []
+    body = json.dumps(
+        [{"tag_name": "v2.0.0", "assets": [{"name": "daemonswright-v2.0.0-win.zip"}]}]
+    ).encode()
+
+    def fake_urlopen(req, *args, **kwargs):
+        calls.append(req)
+        if req.get_header("If-none-match") == '"abc"':
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+        response = _FakeResponse(body)
+        response.headers["ETag"] = '"abc"'
+        return response
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(cli, "_get_wright_cache_dir", lambda: tmp_path)
+    return calls
+
+
+@pytest.mark.unit
+def test_latest_version_reused_while_fresh(releases_api):
+    """Test a recent answer is reused without another API request."""
+    assert cli._get_latest_wright_version() == "v2.0.0"
+    assert cli._get_latest_wright_version() == "v2.0.0"
+
+    assert len(releases_api) == 1
+
+
+@pytest.mark.unit
+def test_latest_version_revalidated_with_etag(releases_api, tmp_path):
+    """Test a stale answer is revalidated with a conditional request."""
+    cli._get_latest_wright_version()
+    meta_path = tmp_path / "releases_meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta["fetched_at"] = time.time() - 3600
+    meta_path.write_text(json.dumps(meta))
+
+    assert cli._get_latest_wright_version() == "v2.0.0"
+
+    assert len(releases_api) == 2
+    assert releases_api[1].get_header("If-none-match") == '"abc"'
+    assert json.loads(meta_path.read_text())["fetched_at"] > meta["fetched_at"]
+
+
+@pytest.mark.unit
+def test_init_leaves_unchanged_starter_files(tmp_path, monkeypatch):
+    """Test re-running `daemons init` only rewrites starter files that differ."""
+    monkeypatch.chdir(tmp_path)
+    CliRunner().invoke(main, ["init", "game"])
+    (tmp_path / "game" / "config.py").write_text("# edited\n")
+
+    result = CliRunner().invoke(main, ["init", "--force", "game"])
+
+    assert result.exit_code == 0, result.output
+    assert "Skipped main.py (already up to date)" in result.output
+    assert "Created config.py" in result.output
+    assert (tmp_path / "game" / "config.py").read_text() == cli._CONFIG_PY
+
+
+@pytest.mark.unit
+def test_init_passes_jobs_to_copier(tmp_path, monkeypatch):
+    """Test `daemons init --jobs` sets the number of copy workers."""
+    monkeypatch.chdir(tmp_path)
+    seen = {}
+    real_copy_tree = cli._copy_tree
+
+    def spy(src, dst, workers=16):
+        seen["workers"] = workers
+        return real_copy_tree(src, dst, workers)
+
+    monkeypatch.setattr(cli, "_copy_tree", spy)
+
+    result = CliRunner().invoke(main, ["init", "--jobs", "2", "game"])
+
+    assert result.exit_code == 0, result.output
+    assert seen["workers"] == 2
+    assert CliRunner().invoke(main, ["init", "--jobs", "0", "other"]).exit_code == 2
+
+
+@pytest.mark.unit
+def test_init_without_bundled_world_data(tmp_path, monkeypatch):
+    """Test `daemons init` falls back to an empty world_data layout."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli, "_PKG_DIR", tmp_path / "no_package")
+
+    result = CliRunner().invoke(main, ["init", "game"])
+
+    assert result.exit_code == 0, result.output
+    for dir_path in cli._FALLBACK_WORLD_DIRS:
+        assert (tmp_path / "game" / dir_path).is_dir()
+
+
+@pytest.mark.unit
+def test_init_refuses_nonempty_directory(tmp_path, monkeypatch):
+    """Test `daemons init` won't scaffold into a non-empty directory."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "game").mkdir()
+    (tmp_path / "game" / "notes.txt").write_text("keep me")
+
+    result = CliRunner().invoke(main, ["init", "game"])
+
+    assert result.exit_code == 1
+    assert not (tmp_path / "game" / "main.py").exists()
+
+
+@pytest.mark.unit
+def test_urlopen_retries_server_errors(monkeypatch):
+    """Test transient server errors are retried and others are not."""
+    monkeypatch.setattr(cli, "_RETRY_BACKOFF", 0)
+    statuses = [503, 502]
+
+    def fake_urlopen(req, *args, **kwargs):
+        if statuses:
+            raise urllib.error.HTTPError(req, statuses.pop(0), "Unavailable", {}, None)
+        return _FakeResponse(b"ok")
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+    assert cli._urlopen("https://example.invalid", timeout=1).read() == b"ok"
+
+    statuses[:] = [404]
+    with pytest.raises(urllib.error.HTTPError):
+        cli._urlopen("https://example.invalid", timeout=1)
+
+
+@pytest.mark.unit
+def test_download_skipped_when_already_installed(tmp_path, fake_download):
+    """Test a completed version is reused instead of downloaded again."""
+    _, requests = fake_download
+    first = cli._download_wright("v1.0.0", tmp_path)
+
+    assert cli._download_wright("v1.0.0", tmp_path) == first
+    assert len(requests) == 1
+
+
+@pytest.mark.unit
+def test_finished_archive_is_not_downloaded_again(tmp_path, fake_download):
+    """Test an archive left by an interrupted run is extracted, not refetched."""
+    _, requests = fake_download
+    version_dir = tmp_path / "v1.0.0"
+    version_dir.mkdir()
+    (version_dir / "daemonswright-v1.0.0-linux.AppImage").write_bytes(b"cached")
+
+    exe_path = cli._download_wright("v1.0.0", tmp_path)
+
+    assert requests == []
+    assert exe_path.read_bytes() == b"cached"
+
+
+def _zip_bytes(tmp_path) -> bytes:
+    archive_path = tmp_path / "build.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("Daemonswright.exe", b"MZ" * 1000)
+    return archive_path.read_bytes()
+
+
+@pytest.fixture
+def fake_zip_download(tmp_path, monkeypatch):
+    """Serve a zip build for every urlopen call on a Windows-like platform."""
+    requests = []
+
+    def fake_urlopen(req, *args, **kwargs):
+        requests.append(req)
+        return _FakeResponse(_zip_bytes(tmp_path))
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(
+        cli, "_get_platform_info", lambda: ("win", ".zip", "Daemonswright.exe")
+    )
+    return requests
+
+
+@pytest.mark.unit
+def test_truncated_archive_is_downloaded_again(tmp_path, fake_zip_download):
+    """Test a leftover archive that is not a valid zip is replaced."""
+    version_dir = tmp_path / "cache" / "v1.0.0"
+    version_dir.mkdir(parents=True)
+    archive_path = version_dir / "daemonswright-v1.0.0-win.zip"
+    archive_path.write_bytes(_zip_bytes(tmp_path)[:100])
+
+    cli._download_wright("v1.0.0", tmp_path / "cache")
+
+    assert len(fake_zip_download) == 1
+    assert (version_dir / "extracted" / "Daemonswright.exe").exists()
+
+
+@pytest.mark.unit
+def test_damaged_archive_is_removed(tmp_path, fake_zip_download):
+    """Test an archive that fails to extract is not reused by the next run."""
+    version_dir = tmp_path / "cache" / "v1.0.0"
+    version_dir.mkdir(parents=True)
+    archive_path = version_dir / "daemonswright-v1.0.0-win.zip"
+    # Corrupt the member data but keep the zip structure intact
+    data = bytearray(_zip_bytes(tmp_path))
+    data[40] ^= 0xFF
+    archive_path.write_bytes(bytes(data))
+
+    assert cli._download_wright("v1.0.0", tmp_path / "cache") is None
+    assert fake_zip_download == []
+    assert not archive_path.exists()
+
+
+@pytest.mark.unit
+def test_find_project_dirs(tmp_path, monkeypatch):
+    """Test only subdirectories holding a main.py are suggested, up to the limit."""
+    for name in ("alpha", "beta", "gamma", "delta"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "main.py").write_text("")
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "main.py.txt").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    assert len(cli._find_project_dirs()) == 3
+    assert sorted(cli._find_project_dirs(limit=10)) == [
+        "alpha",
+        "beta",
+        "delta",
+        "gamma",
+    ]
+
+
+@pytest.mark.unit
+def test_python_dash_m_runs_cli():
+    """Test python -m daemons dispatches to the click group."""
+    result = subprocess.run(
+        [sys.executable, "-m", "daemons", "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.startswith("daemons, version")
@@ -4,6 +4,8 @@ Unit tests for World data structures.
 Tests WorldPlayer, WorldNpc, WorldRoom, World, and related structures.
 """
 
+import sys
+
 import pytest
 
 from daemons.engine.world import (
@@ -359,3 +361,18 @@ def test_targetable_protocol_compliance():
     assert hasattr(player, "get_targetable_type")
 
     assert player.get_targetable_type() == TargetableType.PLAYER
+
+
+@pytest.mark.unit
+def test_world_player_faction_id_is_interned():
+    """Test faction ids built at runtime share one string object."""
+    faction_id = "".join(["wat", "ch"])
+    player = WorldPlayer(
+        id="player_1",
+        entity_type=EntityType.PLAYER,
+        name="TestHero",
+        room_id="room_void",
+        faction_id=faction_id,
+    )
+
+    assert player.faction_id is sys.intern("watch")